@@ -59,11 +59,16 @@ class AnalyticsService:
         if cycle_id:
             contributions = contributions.filter(financial_cycle_id=cycle_id)
         
-        total_savings = contributions.aggregate(total=Sum('amount'))['total'] or Decimal('0.00')
+        savings = contributions.aggregate(
+            total=Sum('amount'),
+            paid_count=Count('id'),
+            on_time_count=Count('id', filter=Q(status='PAID')),
+        )
+        total_savings = savings['total'] or Decimal('0.00')
         
         # Consistency score (percentage of on-time payments)
-        paid_count = contributions.count()
-        on_time_count = contributions.filter(status='PAID').count()
+        paid_count = savings['paid_count']
+        on_time_count = savings['on_time_count']
         consistency_score = (on_time_count / paid_count * 100) if paid_count > 0 else 100
 
         # 3. Distributions
@@ -73,10 +78,23 @@ class AnalyticsService:
         # 4. Growth Trend (Last 12 months)
         growth_trend = self._get_growth_trend(self.user, group_id, cycle_id=cycle_id)
 
+        lifecycle = investments.aggregate(
+            active_count=Count('id', filter=Q(status='ACTIVE')),
+            pending_proposals=Count('id', filter=Q(status='PENDING_APPROVAL')),
+            upcoming_maturities=Count(
+                'id',
+                filter=Q(
+                    status='ACTIVE',
+                    end_date__gte=end_date,
+                    end_date__lte=end_date + timedelta(days=90),
+                ),
+            ),
+        )
+
         return {
             "core_metrics": {
                 "total_invested": total_invested,
-                "active_count": active_investments.count(),
+                "active_count": lifecycle['active_count'],
                 "total_returns": total_returns,
                 "expected_returns": expected_returns,
                 "roi_percentage": round(roi_percentage, 2),
@@ -91,8 +109,8 @@ class AnalyticsService:
                 "growth": growth_trend
             },
             "lifecycle": {
-                "pending_proposals": investments.filter(status='PENDING_APPROVAL').count(),
-                "upcoming_maturities": investments.filter(status='ACTIVE', end_date__gte=end_date, end_date__lte=end_date + timedelta(days=90)).count()
+                "pending_proposals": lifecycle['pending_proposals'],
+                "upcoming_maturities": lifecycle['upcoming_maturities']
             }
         }
 
@@ -111,7 +129,6 @@ class AnalyticsService:
             investments = investments.filter(financial_cycle_id=cycle_id)
         
         # 1. Group Core Metrics
-        active_investments = investments.filter(status='ACTIVE')
         total_capital = investments.filter(status__in=['ACTIVE', 'MATURED', 'CLOSED']).aggregate(total=Sum('amount_invested'))['total'] or Decimal('0.00')
         returns_qs = InvestmentReturn.objects.filter(
             investment__group=group,
@@ -134,16 +151,22 @@ class AnalyticsService:
         risk_dist = list(investments.values('risk_level').annotate(value=Sum('amount_invested'), count=Count('id')))
         
         # Approval Ratio
-        total_decisions = investments.filter(status__in=['APPROVED', 'REJECTED', 'ACTIVE', 'MATURED']).count()
-        approvals = investments.filter(status__in=['APPROVED', 'ACTIVE', 'MATURED']).count()
+        status_counts = investments.aggregate(
+            active_count=Count('id', filter=Q(status='ACTIVE')),
+            pending_proposals=Count('id', filter=Q(status='PENDING_APPROVAL')),
+            total_decisions=Count('id', filter=Q(status__in=['APPROVED', 'REJECTED', 'ACTIVE', 'MATURED'])),
+            approvals=Count('id', filter=Q(status__in=['APPROVED', 'ACTIVE', 'MATURED'])),
+        )
+        total_decisions = status_counts['total_decisions']
+        approvals = status_counts['approvals']
         approval_ratio = (approvals / total_decisions * 100) if total_decisions > 0 else 0
 
         return {
             "group_metrics": {
                 "total_capital": total_capital,
-                "active_invest_count": active_investments.count(),
+                "active_invest_count": status_counts['active_count'],
                 "total_returns_distributed": total_returns_dist,
-                "pending_proposals": investments.filter(status='PENDING_APPROVAL').count(),
+                "pending_proposals": status_counts['pending_proposals'],
                 "active_members": active_members_count,
                 "members_with_investments": members_with_investments,
                 "approval_ratio": round(approval_ratio, 1)
@@ -123,15 +123,14 @@ class FinancialCycleService:
             )
 
             monthly_rows = MonthlyContributionRecord.objects.filter(financial_cycle=cycle)
-            total_expected = monthly_rows.aggregate(
-                total=Sum("expected_contribution_amount")
-            )["total"] or Decimal("0.00")
-            total_collected = monthly_rows.aggregate(
-                total=Sum("actual_contribution_paid")
-            )["total"] or Decimal("0.00")
-            outstanding_total = monthly_rows.aggregate(
-                total=Sum("outstanding_amount")
-            )["total"] or Decimal("0.00")
+            monthly_totals = monthly_rows.aggregate(
+                expected=Sum("expected_contribution_amount"),
+                collected=Sum("actual_contribution_paid"),
+                outstanding=Sum("outstanding_amount"),
+            )
+            total_expected = monthly_totals["expected"] or Decimal("0.00")
+            total_collected = monthly_totals["collected"] or Decimal("0.00")
+            outstanding_total = monthly_totals["outstanding"] or Decimal("0.00")
 
             if total_expected > Decimal("0.00"):
                 fulfillment_rate = (total_collected / total_expected) * Decimal("100")
@@ -10,13 +10,156 @@ import calendar
 from datetime import date
 
 from django.core.management.base import BaseCommand
-from django.db import transaction
+from django.core.management.color import no_style
+from django.db import IntegrityError, transaction
 from django.utils import timezone
 
 from finance.models import AutoSavingConfig, Contribution, MonthlySavingGeneration
+from finance.services import InsightService
 from notifications.models import Notification
 
 
+BATCH_SIZE = 500
+
+
+def _create_generated_contributions(configs, target_date, due_date):
+    """Insert the contributions, audit rows and notifications for ``configs`` in bulk."""
+    with transaction.atomic():
+        cycles = {}
+        contributions = []
+        for config in configs:
+            contribution = Contribution(
+                user=config.user,
+                group=config.group,
+                amount=config.amount,
+                due_date=due_date,
+                status="PENDING",
+            )
+            # Every config in a group shares the same month, hence the same cycle.
+            if config.group_id in cycles:
+                contribution.financial_cycle = cycles[config.group_id]
+            # bulk_create skips Contribution.save(), so apply its defaults here.
+            contribution.prepare_for_save()
+            cycles[config.group_id] = contribution.financial_cycle
+            contributions.append(contribution)
+
+        Contribution.objects.bulk_create(contributions, batch_size=BATCH_SIZE)
+        MonthlySavingGeneration.objects.bulk_create(
+            [
+                MonthlySavingGeneration(
+                    config=config,
+                    contribution=contribution,
+                    generated_for_month=target_date,
+                )
+                for config, contribution in zip(configs, contributions)
+            ],
+            batch_size=BATCH_SIZE,
+        )
+        Notification.objects.bulk_create(
+            [
+                Notification(
+                    recipient=config.user,
+                    type="SUCCESS",
+                    title="Monthly Auto-Save Scheduled",
+                    message=(
+                        f"Your monthly auto-save of KSh {config.amount:,.2f} has been "
+                        f"scheduled for {config.group.name}. Due by "
+                        f"{due_date.strftime('%B %d, %Y')}."
+                    ),
+                )
+                for config in configs
+            ],
+            batch_size=BATCH_SIZE,
+        )
+
+    # No post_save signals fire for bulk inserts.
+    InsightService.invalidate(*{config.user_id for config in configs})
+
+
+def run(target_date=None, dry_run=False, stdout=None, style=None):
+    """
+    Generate contributions for every active config for the month starting at
+    ``target_date`` (defaults to the current month).
+
+    Callable without going through ``call_command``; returns
+    ``(created_count, skipped_count)``.
+    """
+    style = style or no_style()
+
+    def write(message=""):
+        if stdout is not None:
+            stdout.write(message)
+
+    if target_date is None:
+        today = timezone.now().date()
+        target_date = date(today.year, today.month, 1)
+
+    last_day = calendar.monthrange(target_date.year, target_date.month)[1]
+    due_date = date(target_date.year, target_date.month, last_day)
+
+    write(f"Generating contributions for {target_date.strftime('%B %Y')}")
+    write(f"Due date: {due_date}")
+
+    active_configs = list(
+        AutoSavingConfig.objects.filter(is_active=True).select_related("user", "group")
+    )
+    if not active_configs:
+        write(style.WARNING("No active auto-saving configs found."))
+        return 0, 0
+
+    generated_config_ids = set(
+        MonthlySavingGeneration.objects.filter(
+            config__in=active_configs,
+            generated_for_month=target_date,
+        ).values_list("config_id", flat=True)
+    )
+
+    pending = []
+    skipped_count = 0
+
+    for config in active_configs:
+        if config.id in generated_config_ids:
+            write(
+                style.WARNING(
+                    f"  SKIP: {config.user} - {config.group} (already generated)"
+                )
+            )
+            skipped_count += 1
+            continue
+
+        if dry_run:
+            write(
+                style.SUCCESS(
+                    f"  DRY-RUN: Would create {config.amount} for "
+                    f"{config.user} in {config.group}"
+                )
+            )
+
+        pending.append(config)
+
+    if pending and not dry_run:
+        try:
+            _create_generated_contributions(pending, target_date, due_date)
+        except IntegrityError:
+            # unique_monthly_generation rejected a row another run inserted
+            # after our pre-check; the whole batch was rolled back.
+            write(style.WARNING("Generation for this month was completed by a concurrent run."))
+            return 0, skipped_count + len(pending)
+        for config in pending:
+            write(
+                style.SUCCESS(
+                    f"  CREATED: {config.amount} for {config.user} in {config.group}"
+                )
+            )
+
+    created_count = len(pending)
+
+    write()
+    write(style.SUCCESS(f"Created: {created_count}"))
+    write(style.WARNING(f"Skipped: {skipped_count}"))
+    return created_count, skipped_count
+
+
 class Command(BaseCommand):
     help = "Generate monthly contributions for active auto-saving configs"
 
@@ -36,6 +179,7 @@ class Command(BaseCommand):
         dry_run = options.get("dry_run", False)
         month_str = options.get("month")
 
+        target_date = None
         if month_str:
             try:
                 year, month = map(int, month_str.split("-"))
@@ -43,82 +187,10 @@ class Command(BaseCommand):
             except ValueError:
                 self.stderr.write(self.style.ERROR("Invalid month format. Use YYYY-MM"))
                 return
-        else:
-            today = timezone.now().date()
-            target_date = date(today.year, today.month, 1)
-
-        last_day = calendar.monthrange(target_date.year, target_date.month)[1]
-        due_date = date(target_date.year, target_date.month, last_day)
-
-        self.stdout.write(f"Generating contributions for {target_date.strftime('%B %Y')}")
-        self.stdout.write(f"Due date: {due_date}")
-
-        active_configs = AutoSavingConfig.objects.filter(is_active=True)
-        if not active_configs.exists():
-            self.stdout.write(self.style.WARNING("No active auto-saving configs found."))
-            return
-
-        created_count = 0
-        skipped_count = 0
-
-        for config in active_configs:
-            already_generated = MonthlySavingGeneration.objects.filter(
-                config=config,
-                generated_for_month=target_date,
-            ).exists()
-
-            if already_generated:
-                self.stdout.write(
-                    self.style.WARNING(
-                        f"  SKIP: {config.user} - {config.group} (already generated)"
-                    )
-                )
-                skipped_count += 1
-                continue
-
-            if dry_run:
-                self.stdout.write(
-                    self.style.SUCCESS(
-                        f"  DRY-RUN: Would create {config.amount} for "
-                        f"{config.user} in {config.group}"
-                    )
-                )
-                created_count += 1
-                continue
-
-            with transaction.atomic():
-                contribution = Contribution.objects.create(
-                    user=config.user,
-                    group=config.group,
-                    amount=config.amount,
-                    due_date=due_date,
-                    status="PENDING",
-                )
-
-                MonthlySavingGeneration.objects.create(
-                    config=config,
-                    contribution=contribution,
-                    generated_for_month=target_date,
-                )
 
-                Notification.objects.create(
-                    recipient=config.user,
-                    type="SUCCESS",
-                    title="Monthly Auto-Save Scheduled",
-                    message=(
-                        f"Your monthly auto-save of KSh {config.amount:,.2f} has been "
-                        f"scheduled for {config.group.name}. Due by "
-                        f"{due_date.strftime('%B %d, %Y')}."
-                    ),
-                )
-
-                self.stdout.write(
-                    self.style.SUCCESS(
-                        f"  CREATED: {config.amount} for {config.user} in {config.group}"
-                    )
-                )
-                created_count += 1
-
-        self.stdout.write("")
-        self.stdout.write(self.style.SUCCESS(f"Created: {created_count}"))
-        self.stdout.write(self.style.WARNING(f"Skipped: {skipped_count}"))
+        run(
+            target_date=target_date,
+            dry_run=dry_run,
+            stdout=self.stdout,
+            style=self.style,
+        )
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.10 on 2026-10-15 22:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("finance", "0011_financial_cycles_and_monthly_reporting"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="contribution",
+            index=models.Index(fields=["group", "due_date"], name="contrib_group_due_idx"),
+        ),
+    ]
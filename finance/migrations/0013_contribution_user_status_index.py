@@ -0,0 +1,17 @@
+# Generated by Django 5.2.10 on 2026-10-15 23:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("finance", "0012_contribution_group_due_date_index"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="contribution",
+            index=models.Index(fields=["user", "status"], name="contrib_user_status_idx"),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.10 on 2026-10-15 23:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("finance", "0013_contribution_user_status_index"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="contribution",
+            index=models.Index(fields=["user", "due_date"], name="contrib_user_due_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="penalty",
+            index=models.Index(fields=["user", "is_archived"], name="penalty_user_archived_idx"),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.10 on 2026-10-15 23:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("finance", "0014_contribution_user_due_penalty_user_archived_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="contribution",
+            index=models.Index(fields=["group", "status"], name="contrib_group_status_idx"),
+        ),
+    ]
@@ -220,6 +220,13 @@ class Penalty(models.Model):
     
     is_archived = models.BooleanField(default=False)
 
+    class Meta:
+        indexes = [
+            # Backs the member penalty list and the reset counts
+            # (user_id = ? AND is_archived = false).
+            models.Index(fields=["user", "is_archived"], name="penalty_user_archived_idx"),
+        ]
+
 # =========================
 # Contribution Model
 # =========================
@@ -315,6 +322,18 @@ class Contribution(models.Model):
 
     class Meta:
         ordering = ["due_date", "created_at"]
+        indexes = [
+            # Backs the month-window scans in ReportService
+            # (group_id = ? AND due_date >= ? AND due_date < ?).
+            models.Index(fields=["group", "due_date"], name="contrib_group_due_idx"),
+            # Backs per-member status aggregates (InsightService summary).
+            models.Index(fields=["user", "status"], name="contrib_user_status_idx"),
+            # Backs the member contribution list, which is ordered by due date.
+            models.Index(fields=["user", "due_date"], name="contrib_user_due_idx"),
+            # Backs the per-group totals on the group list
+            # (group_id = ? AND status IN ('PAID', 'LATE')).
+            models.Index(fields=["group", "status"], name="contrib_group_status_idx"),
+        ]
 
     def __str__(self):
         return f"{self.user} - {self.amount} ({self.status})"
@@ -418,8 +437,8 @@ class Contribution(models.Model):
     # -------------------------
     # Auto-update on save
     # -------------------------
-    def save(self, *args, **kwargs):
-        skip_status_evaluation = kwargs.pop("skip_status_evaluation", False)
+    def prepare_for_save(self, skip_status_evaluation=False):
+        """Apply the defaults save() enforces; also used before bulk_create."""
         self._assign_cycle_defaults()
         self._validate_cycle_integrity()
 
@@ -432,6 +451,9 @@ class Contribution(models.Model):
         if self.penalty == Decimal("0.00"):
             self.penalty = suggested_penalty
 
+    def save(self, *args, **kwargs):
+        skip_status_evaluation = kwargs.pop("skip_status_evaluation", False)
+        self.prepare_for_save(skip_status_evaluation=skip_status_evaluation)
         super().save(*args, **kwargs)
 
 
@@ -653,15 +675,25 @@ class SavingsTarget(models.Model):
     def __str__(self):
         return f"{self.name} - {self.target_amount} ({self.user})"
 
+    @classmethod
+    def saved_contributions_filter(cls, user, group, start_date):
+        return {
+            "user": user,
+            "group": group,
+            "status": "PAID",
+            "paid_date__gte": start_date,
+            "is_archived": False,
+        }
+
     @property
     def total_saved(self):
         """Calculate total saved from PAID contributions after start_date."""
+        # List views annotate this up front to avoid a SUM query per target.
+        annotated = getattr(self, "annotated_total_saved", None)
+        if annotated is not None:
+            return annotated
         return Contribution.objects.filter(
-            user=self.user,
-            group=self.group,
-            status="PAID",
-            paid_date__gte=self.start_date,
-            is_archived=False,
+            **self.saved_contributions_filter(self.user_id, self.group_id, self.start_date)
         ).aggregate(
             total=models.Sum("amount")
         )["total"] or Decimal("0.00")
@@ -1,5 +1,7 @@
+from rest_framework import permissions
 from rest_framework.permissions import BasePermission
 from groups.models import Membership
+from groups.utils import get_membership_role, is_group_member
 
 
 class HasFinanceAccess(BasePermission):
@@ -42,12 +44,12 @@ class HasFinanceAccess(BasePermission):
             self.message = "Group context is required."
             return False
 
-        return Membership.objects.filter(
-            user=user,
-            group_id=group_id,
-            role__in=["TREASURER", "MEMBER"],
-        ).exists()
-from rest_framework import permissions
+        try:
+            group_id = int(group_id)
+        except (TypeError, ValueError):
+            return False
+
+        return get_membership_role(user.id, group_id) in ("TREASURER", "MEMBER")
 
 
 class PenaltyPermission(permissions.BasePermission):
@@ -84,6 +86,38 @@ class PenaltyPermission(permissions.BasePermission):
         return False
 
 
+class IsAdminOrGroupTreasurer(BasePermission):
+    """
+    Admins and superusers pass outright; treasurers only for objects that
+    belong to a group they are the treasurer of.
+    """
+
+    message = "Only admins and treasurers can perform this action."
+
+    def has_permission(self, request, view):
+        user = request.user
+        if not user or not user.is_authenticated:
+            return False
+        return user.is_superuser or user.role in ("ADMIN", "TREASURER")
+
+    def has_object_permission(self, request, view, obj):
+        user = request.user
+        if user.is_superuser or user.role == "ADMIN":
+            return True
+        self.message = "You can only manage records in your own group."
+        return obj.group.treasurer_id == user.id
+
+
+class IsFinanceAdmin(BasePermission):
+    message = "Only admins can perform this action."
+
+    def has_permission(self, request, view):
+        user = request.user
+        if not user or not user.is_authenticated:
+            return False
+        return user.is_superuser or user.role == "ADMIN"
+
+
 class IsTreasurerOrAdmin(BasePermission):
     def has_permission(self, request, view):
         return request.user.role in ["ADMIN", "TREASURER", "FINANCIAL_SECRETARY"]
@@ -96,7 +130,7 @@ class IsFinancialSecretary(BasePermission):
 
 class IsTreasurerOrAdminOrFinancialSecretaryReadOnly(BasePermission):
     def has_permission(self, request, view):
-        if request.user.role in ["ADMIN", "TREASURER"]:
+        if request.user.is_superuser or request.user.role in ["ADMIN", "TREASURER"]:
             return True
         if request.user.role == "FINANCIAL_SECRETARY" and request.method in permissions.SAFE_METHODS:
             return True
@@ -105,4 +139,4 @@ class IsTreasurerOrAdminOrFinancialSecretaryReadOnly(BasePermission):
 
 class IsGroupMember(BasePermission):
     def has_object_permission(self, request, view, obj):
-        return obj.group.members.filter(id=request.user.id).exists()
+        return is_group_member(request.user.id, obj.group_id)
@@ -55,44 +55,43 @@ class ReportService:
             investments = investments.filter(financial_cycle_id=cycle_id)
             monthly_rows = monthly_rows.filter(financial_cycle_id=cycle_id)
 
-        total_savings = contributions.filter(status="PAID").aggregate(Sum("amount"))["amount__sum"] or Decimal("0.00")
-        total_penalties = penalties.aggregate(Sum("amount"))["amount__sum"] or Decimal("0.00")
-        
-        pending_amount = contributions.filter(status="PENDING").aggregate(Sum("amount"))["amount__sum"] or Decimal("0.00")
-        overdue_amount = contributions.filter(status="OVERDUE").aggregate(Sum("amount"))["amount__sum"] or Decimal("0.00")
-
-        total_expected = monthly_rows.aggregate(Sum("expected_contribution_amount"))[
-            "expected_contribution_amount__sum"
-        ] or Decimal("0.00")
-        total_collected = monthly_rows.aggregate(Sum("actual_contribution_paid"))[
-            "actual_contribution_paid__sum"
-        ] or Decimal("0.00")
-        outstanding_totals = monthly_rows.aggregate(Sum("outstanding_amount"))[
-            "outstanding_amount__sum"
-        ] or Decimal("0.00")
+        zero = Decimal("0.00")
+        # One pass per table instead of a query per figure.
+        contribution_stats = contributions.aggregate(
+            total_savings=Sum("amount", filter=Q(status="PAID")),
+            pending_amount=Sum("amount", filter=Q(status="PENDING")),
+            overdue_amount=Sum("amount", filter=Q(status="OVERDUE")),
+            total_count=Count("id"),
+            paid_count=Count("id", filter=Q(status="PAID")),
+        )
+        total_penalties = penalties.aggregate(Sum("amount"))["amount__sum"] or zero
+        monthly_totals = monthly_rows.aggregate(
+            expected=Sum("expected_contribution_amount"),
+            collected=Sum("actual_contribution_paid"),
+            outstanding=Sum("outstanding_amount"),
+        )
 
         return {
             "month": month,
             "year": year,
             "cycle_id": cycle_id,
-            "total_savings": total_savings,
+            "total_savings": contribution_stats["total_savings"] or zero,
             "total_penalties": total_penalties,
-            "pending_amount": pending_amount,
-            "overdue_amount": overdue_amount,
+            "pending_amount": contribution_stats["pending_amount"] or zero,
+            "overdue_amount": contribution_stats["overdue_amount"] or zero,
             "active_investments_count": investments.count(),
-            "collection_rate": ReportService._calculate_collection_rate(contributions),
-            "total_expected_contributions": total_expected,
-            "total_collected_contributions": total_collected,
-            "outstanding_totals": outstanding_totals,
+            "collection_rate": ReportService._calculate_collection_rate(contribution_stats),
+            "total_expected_contributions": monthly_totals["expected"] or zero,
+            "total_collected_contributions": monthly_totals["collected"] or zero,
+            "outstanding_totals": monthly_totals["outstanding"] or zero,
         }
 
     @staticmethod
-    def _calculate_collection_rate(queryset):
-        total_count = queryset.count()
-        if total_count == 0:
+    def _calculate_collection_rate(counts):
+        if counts["total_count"] == 0:
             return 100.0
-        paid_count = queryset.filter(status="PAID").count()
-        return round((paid_count / total_count) * 100, 2)
+        return round((counts["paid_count"] / counts["total_count"]) * 100, 2)
+
     @staticmethod
     def get_user_reset_report(user):
         """
@@ -146,15 +145,14 @@ class ReportService:
             }
 
         monthly_rows = MonthlyContributionRecord.objects.filter(financial_cycle_id=cycle_id)
-        total_expected = monthly_rows.aggregate(Sum("expected_contribution_amount"))[
-            "expected_contribution_amount__sum"
-        ] or Decimal("0.00")
-        total_collected = monthly_rows.aggregate(Sum("actual_contribution_paid"))[
-            "actual_contribution_paid__sum"
-        ] or Decimal("0.00")
-        outstanding_totals = monthly_rows.aggregate(Sum("outstanding_amount"))[
-            "outstanding_amount__sum"
-        ] or Decimal("0.00")
+        monthly_totals = monthly_rows.aggregate(
+            expected=Sum("expected_contribution_amount"),
+            collected=Sum("actual_contribution_paid"),
+            outstanding=Sum("outstanding_amount"),
+        )
+        total_expected = monthly_totals["expected"] or Decimal("0.00")
+        total_collected = monthly_totals["collected"] or Decimal("0.00")
+        outstanding_totals = monthly_totals["outstanding"] or Decimal("0.00")
 
         if total_expected > Decimal("0.00"):
             fulfillment_rate = round((total_collected / total_expected) * Decimal("100"), 2)
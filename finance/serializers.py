@@ -1,4 +1,6 @@
 from datetime import date
+from django.core.validators import MaxValueValidator, MinValueValidator
+from django.db import IntegrityError, transaction
 from django.db.models import Sum
 from decimal import Decimal
 from rest_framework import serializers
@@ -17,9 +19,24 @@ from .models import (
 )
 from .constants import MIN_MONTHLY_SAVING
 from groups.models import Group, Membership
+from groups.utils import is_request_group_member
 
 User = get_user_model()
 
+# Shared field validators, built once at import time.
+POSITIVE_AMOUNT_VALIDATOR = MinValueValidator(
+    Decimal("0.01"),
+    message="Amount must be greater than zero.",
+)
+MIN_MONTHLY_SAVING_VALIDATOR = MinValueValidator(
+    MIN_MONTHLY_SAVING,
+    message=f"Amount must be at least KSh {MIN_MONTHLY_SAVING}",
+)
+DAY_OF_MONTH_VALIDATORS = [
+    MinValueValidator(1, message="Day of month must be between 1 and 28"),
+    MaxValueValidator(28, message="Day of month must be between 1 and 28"),
+]
+
 
 class ContributionSerializer(serializers.ModelSerializer):
     suggested_penalty = serializers.SerializerMethodField()
@@ -45,7 +62,11 @@ class ContributionSerializer(serializers.ModelSerializer):
 
 class ManualContributionProposalSerializer(serializers.Serializer):
     group_id = serializers.IntegerField(required=False)
-    amount = serializers.DecimalField(max_digits=10, decimal_places=2)
+    amount = serializers.DecimalField(
+        max_digits=10,
+        decimal_places=2,
+        validators=[POSITIVE_AMOUNT_VALIDATOR],
+    )
     reported_paid_date = serializers.DateField(required=False)
     reported_payment_method = serializers.ChoiceField(
         choices=Contribution.PAYMENT_METHOD_CHOICES,
@@ -61,11 +82,6 @@ class ManualContributionProposalSerializer(serializers.Serializer):
         allow_blank=True,
     )
 
-    def validate_amount(self, value):
-        if value <= 0:
-            raise serializers.ValidationError("Amount must be greater than zero.")
-        return value
-
     def validate_reported_paid_date(self, value):
         if value > date.today():
             raise serializers.ValidationError(
@@ -83,10 +99,13 @@ class ManualContributionProposalSerializer(serializers.Serializer):
 
         group = None
         if group_id is None:
-            memberships = Membership.objects.filter(user=user).select_related("group")
-            membership_count = memberships.count()
+            # Two rows are enough to tell "exactly one" from "several".
+            memberships = list(
+                Membership.objects.filter(user=user).select_related("group")[:2]
+            )
+            membership_count = len(memberships)
             if membership_count == 1:
-                group = memberships.first().group
+                group = memberships[0].group
             elif membership_count == 0:
                 raise serializers.ValidationError(
                     {"group_id": "You do not belong to any group."}
@@ -137,6 +156,10 @@ class ManualContributionProposalSerializer(serializers.Serializer):
         contribution.save(skip_status_evaluation=True)
         return contribution
 
+    def to_representation(self, instance):
+        # Respond with the stored contribution rather than the proposal input.
+        return ContributionSerializer(context=self.context).to_representation(instance)
+
 
 class PenaltySerializer(serializers.ModelSerializer):
     status = serializers.SerializerMethodField()
@@ -158,6 +181,13 @@ class PenaltySerializer(serializers.ModelSerializer):
             "created_at",
         )
         read_only_fields = ("created_at", "applied_by")
+        extra_kwargs = {
+            # perform_create and the response read the contribution's group
+            # and user; load them with the contribution lookup.
+            "contribution": {
+                "queryset": Contribution.objects.select_related("group", "user"),
+            },
+        }
 
     def get_status(self, obj):
         contribution = obj.contribution
@@ -185,7 +215,9 @@ class PenaltySerializer(serializers.ModelSerializer):
         if not user:
             return None
 
-        membership = user.membership_set.select_related("group").first()
+        # Reads the memberships prefetched by PenaltyViewSet instead of
+        # issuing a .first() query per standalone penalty.
+        membership = min(user.membership_set.all(), key=lambda m: m.pk, default=None)
         if membership and membership.group:
             return membership.group.name
 
@@ -204,6 +236,13 @@ class InsightSerializer(serializers.Serializer):
 class AutoSavingConfigSerializer(serializers.ModelSerializer):
     group_name = serializers.CharField(source="group.name", read_only=True)
 
+    # One active config per user/group is enforced by the
+    # unique_active_config_per_user_group constraint; a violation is
+    # reported with the same 400 the API has always returned.
+    ACTIVE_CONFIG_CONFLICT = {
+        "group": "You already have an active auto-saving config for this group"
+    }
+
     class Meta:
         model = AutoSavingConfig
         fields = [
@@ -218,42 +257,37 @@ class AutoSavingConfigSerializer(serializers.ModelSerializer):
             "updated_at",
         ]
         read_only_fields = ("user", "created_at", "updated_at")
-
-    def validate_amount(self, value):
-        if value < MIN_MONTHLY_SAVING:
-            raise serializers.ValidationError(
-                f"Amount must be at least KSh {MIN_MONTHLY_SAVING}"
-            )
-        return value
-
-    def validate_day_of_month(self, value):
-        if not (1 <= value <= 28):
-            raise serializers.ValidationError(
-                "Day of month must be between 1 and 28"
-            )
-        return value
+        extra_kwargs = {
+            "amount": {"validators": [MIN_MONTHLY_SAVING_VALIDATOR]},
+            "day_of_month": {"validators": DAY_OF_MONTH_VALIDATORS},
+        }
 
     def validate(self, attrs):
-        user = self.context["request"].user
+        request = self.context["request"]
         group = attrs.get("group")
 
         # Check if user is member of the group
-        if group and not Membership.objects.filter(user=user, group=group).exists():
+        if group and not is_request_group_member(request, group.id):
             raise serializers.ValidationError({
                 "group": "You are not a member of this group"
             })
 
-        # Check for existing active config (on create only)
-        if not self.instance:  # Creating new
-            if AutoSavingConfig.objects.filter(
-                user=user, group=group, is_active=True
-            ).exists():
-                raise serializers.ValidationError({
-                    "group": "You already have an active auto-saving config for this group"
-                })
-
         return attrs
 
+    def create(self, validated_data):
+        try:
+            with transaction.atomic():
+                return super().create(validated_data)
+        except IntegrityError:
+            raise serializers.ValidationError(self.ACTIVE_CONFIG_CONFLICT)
+
+    def update(self, instance, validated_data):
+        try:
+            with transaction.atomic():
+                return super().update(instance, validated_data)
+        except IntegrityError:
+            raise serializers.ValidationError(self.ACTIVE_CONFIG_CONFLICT)
+
 
 class MonthlySavingGenerationSerializer(serializers.ModelSerializer):
     group_name = serializers.CharField(source="config.group.name", read_only=True)
@@ -308,11 +342,11 @@ class SavingsTargetSerializer(serializers.ModelSerializer):
         read_only_fields = ("user", "is_completed", "created_at")
 
     def validate(self, attrs):
-        user = self.context["request"].user
+        request = self.context["request"]
         group = attrs.get("group")
 
         # Check if user is member of the group
-        if group and not Membership.objects.filter(user=user, group=group).exists():
+        if group and not is_request_group_member(request, group.id):
             raise serializers.ValidationError({
                 "group": "You are not a member of this group"
             })
@@ -507,19 +541,23 @@ class InvestmentSerializer(serializers.ModelSerializer):
         )
 
     def validate(self, attrs):
-        user = self.context["request"].user
+        request = self.context["request"]
+        user = request.user
         group = attrs.get("group")
 
-        if not group:
-            if self.instance:
-                group = self.instance.group
-            else:
-                raise serializers.ValidationError({"group": "Group is required."})
+        # Only the id is needed; avoid loading instance.group on updates.
+        if group:
+            group_id = group.id
+        elif self.instance:
+            group_id = self.instance.group_id
+        else:
+            raise serializers.ValidationError({"group": "Group is required."})
 
         # Check if user is member of the group
-        is_admin = user.role == "ADMIN" or user.is_superuser
+        role = user.role
+        is_admin = role == "ADMIN" or user.is_superuser
         
-        if not Membership.objects.filter(user=user, group=group).exists() and not is_admin:
+        if not is_admin and not is_request_group_member(request, group_id):
             raise serializers.ValidationError({"group": "You are not a member of this group."})
 
         # Validate dates
@@ -675,28 +713,34 @@ class InvestmentProposalDetailSerializer(InvestmentSerializer):
 class AdminAddContributionSerializer(serializers.Serializer):
     user_id = serializers.IntegerField()
     group_id = serializers.IntegerField()
-    amount = serializers.DecimalField(max_digits=10, decimal_places=2)
+    amount = serializers.DecimalField(
+        max_digits=10,
+        decimal_places=2,
+        validators=[POSITIVE_AMOUNT_VALIDATOR],
+    )
     paid_date = serializers.DateField(required=False)
 
     def validate_user_id(self, value):
-        try:
-            user = User.objects.get(pk=value, is_approved=True)
-        except User.DoesNotExist:
+        # Kept for validate() so the row is only fetched once.
+        self._user = User.objects.filter(pk=value, is_approved=True).first()
+        if self._user is None:
             raise serializers.ValidationError("User not found or not approved.")
         return value
 
     def validate_group_id(self, value):
-        try:
-            Group.objects.get(pk=value)
-        except Group.DoesNotExist:
+        self._group = Group.objects.filter(pk=value).first()
+        if self._group is None:
             raise serializers.ValidationError("Group not found.")
         return value
 
     def validate(self, attrs):
-        user = User.objects.get(pk=attrs["user_id"])
-        group = Group.objects.get(pk=attrs["group_id"])
+        user = self._user
+        group = self._group
 
-        if not Membership.objects.filter(user=user, group=group).exists():
+        if not Membership.objects.filter(
+            user_id=attrs["user_id"],
+            group_id=attrs["group_id"],
+        ).exists():
             raise serializers.ValidationError(
                 {"group_id": "Selected member does not belong to this group."}
             )
@@ -718,11 +762,6 @@ class AdminAddContributionSerializer(serializers.Serializer):
         attrs["group_obj"] = group
         return attrs
 
-    def validate_amount(self, value):
-        if value <= 0:
-            raise serializers.ValidationError("Amount must be greater than zero.")
-        return value
-
     def create(self, validated_data):
         paid_date = validated_data.get('paid_date', date.today())
         user = validated_data["user_obj"]
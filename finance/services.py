@@ -1,23 +1,75 @@
+from django.core.cache import cache
 from django.db import models, transaction
 from django.db.models import Sum, Count, Q
 from django.utils import timezone
 from datetime import date
 import calendar
 from .models import Contribution, Penalty, AutoSavingConfig, MonthlySavingGeneration
+from notifications.bulk import batched_notifications
 from notifications.models import Notification
 from groups.models import Membership, Group
 from accounts.emails import send_penalty_notification_email
 from .cycle_services import FinancialCycleService
 
+# =========================
+# Insight recommendation templates
+# =========================
+PENALTY_RECOMMENDATION = {
+    "type": "WARNING",
+    "message": "You have paid a total of {total_penalties} in penalties. Setting up calendar reminders can help save money.",
+    "action": "Set Reminder",
+}
+PUNCTUALITY_TIP_RECOMMENDATION = {
+    "type": "TIP",
+    "message": "Your on-time payment score is below 80%. Try paying 2 days before the due date to account for processing delays.",
+    "action": "View Due Dates",
+}
+PERFECT_RECORD_RECOMMENDATION = {
+    "type": "SUCCESS",
+    "message": "Excellent! You have a perfect payment record. Keep it up to build trust within your group.",
+    "action": None,
+}
+OVERDUE_RECOMMENDATION = {
+    "type": "URGENT",
+    "message": "You have {overdue} overdue payments. Please clear them immediately to avoid further penalties.",
+    "action": "Pay Now",
+}
+
+
+def _render_recommendation(template, **values):
+    recommendation = dict(template)
+    recommendation["message"] = template["message"].format(**values)
+    return recommendation
+
+
 class InsightService:
-    # ... (rest of InsightService stays same)
+    # Insights only change when a contribution or penalty is written, which
+    # evicts the entry (see finance.signals); the TTL covers bulk updates.
+    CACHE_TIMEOUT = 60
+
     def __init__(self, user):
         self.user = user
 
+    @staticmethod
+    def cache_key(user_id):
+        return f"insights:v1:{user_id}"
+
+    @classmethod
+    def invalidate(cls, *user_ids):
+        cache.delete_many([cls.cache_key(user_id) for user_id in user_ids if user_id])
+
     def get_insights(self):
         """
         Main entry point to get all insights.
         """
+        key = self.cache_key(self.user.id)
+        insights = cache.get(key)
+        if insights is None:
+            insights = self._build_insights()
+            cache.set(key, insights, self.CACHE_TIMEOUT)
+        return insights
+
+    def _build_insights(self):
         summary = self._get_summary()
         recommendations = self._generate_recommendations(summary)
         
@@ -28,61 +80,64 @@ class InsightService:
         }
 
     def _get_summary(self):
-        contributions = Contribution.objects.filter(user=self.user, is_archived=False)
-        penalties = Penalty.objects.filter(contribution__user=self.user)
+        # One pass over the member's contributions instead of a query per metric.
+        active = Q(is_archived=False)
+        paid = active & Q(status__in=["PAID", "LATE"])
+        stats = Contribution.objects.filter(user=self.user).aggregate(
+            # Includes archived rows: penalties stay linked to them.
+            contribution_count=Count("id"),
+            total_contributed=Sum("amount", filter=paid),
+            total_paid_count=Count("id", filter=paid),
+            late_count=Count("id", filter=active & Q(status="LATE")),
+            pending_count=Count("id", filter=active & Q(status="PENDING")),
+            overdue_count=Count("id", filter=active & Q(status="OVERDUE")),
+        )
+
+        # Penalties are reached through contributions; without any there is
+        # nothing to sum, so skip the join.
+        total_penalties = 0
+        if stats["contribution_count"]:
+            total_penalties = Penalty.objects.filter(contribution__user=self.user).aggregate(
+                total=Sum("amount")
+            )["total"] or 0
 
-        total_contributed = contributions.filter(status__in=["PAID", "LATE"]).aggregate(Sum("amount"))["amount__sum"] or 0
-        total_penalties = penalties.aggregate(Sum("amount"))["amount__sum"] or 0
-        
         # Punctuality metrics
-        total_paid_count = contributions.filter(status__in=["PAID", "LATE"]).count()
-        late_count = contributions.filter(status="LATE").count()
+        total_paid_count = stats["total_paid_count"]
         on_time_percentage = 0
         if total_paid_count > 0:
-            on_time_percentage = ((total_paid_count - late_count) / total_paid_count) * 100
+            on_time_percentage = ((total_paid_count - stats["late_count"]) / total_paid_count) * 100
 
         return {
-            "total_contributed": total_contributed,
+            "total_contributed": stats["total_contributed"] or 0,
             "total_penalties_paid": total_penalties,
             "on_time_percentage": round(on_time_percentage, 1),
-            "pending_contributions": contributions.filter(status="PENDING").count(),
-            "overdue_contributions": contributions.filter(status="OVERDUE").count(),
+            "pending_contributions": stats["pending_count"],
+            "overdue_contributions": stats["overdue_count"],
         }
 
     def _generate_recommendations(self, summary):
-        recommendations = []
-        
+        return list(self._iter_recommendations(summary))
+
+    def _iter_recommendations(self, summary):
+        total_penalties = summary["total_penalties_paid"]
+        on_time_percentage = summary["on_time_percentage"]
+        has_contributed = summary["total_contributed"] > 0
+        overdue = summary["overdue_contributions"]
+
         # 1. Penalty Analysis
-        if summary["total_penalties_paid"] > 0:
-            recommendations.append({
-                "type": "WARNING",
-                "message": f"You have paid a total of {summary['total_penalties_paid']} in penalties. Setting up calendar reminders can help save money.",
-                "action": "Set Reminder"
-            })
-        
+        if total_penalties > 0:
+            yield _render_recommendation(PENALTY_RECOMMENDATION, total_penalties=total_penalties)
+
         # 2. Punctuality Analysis
-        if summary["on_time_percentage"] < 80 and summary["total_contributed"] > 0:
-             recommendations.append({
-                "type": "TIP",
-                "message": "Your on-time payment score is below 80%. Try paying 2 days before the due date to account for processing delays.",
-                "action": "View Due Dates"
-            })
-        elif summary["on_time_percentage"] == 100 and summary["total_contributed"] > 0:
-             recommendations.append({
-                "type": "SUCCESS",
-                "message": "Excellent! You have a perfect payment record. Keep it up to build trust within your group.",
-                "action": None
-            })
+        if has_contributed:
+            if on_time_percentage < 80:
+                yield dict(PUNCTUALITY_TIP_RECOMMENDATION)
+            elif on_time_percentage == 100:
+                yield dict(PERFECT_RECORD_RECOMMENDATION)
 
         # 3. Urgent Actions
-        if summary["overdue_contributions"] > 0:
-             recommendations.append({
-                "type": "URGENT",
-                "message": f"You have {summary['overdue_contributions']} overdue payments. Please clear them immediately to avoid further penalties.",
-                "action": "Pay Now"
-            })
-
-        return recommendations
+        if overdue > 0:
+            yield _render_recommendation(OVERDUE_RECOMMENDATION, overdue=overdue)
 
 
 class AutoSaveService:
@@ -172,98 +227,101 @@ class AutoSaveService:
         penalty_count = 0
         errors = []
 
-        for group in groups:
-            interval = group.savings_interval
+        # Penalty notifications from the signal handlers are inserted in one
+        # batch at the end rather than once per issued penalty.
+        with batched_notifications():
+            for group in groups:
+                interval = group.savings_interval
             
-            # Determine if we should check compliance today
-            should_check = False
-            start_check = None
-            end_check = None
+                # Determine if we should check compliance today
+                should_check = False
+                start_check = None
+                end_check = None
 
-            if interval == 'DAILY':
-                # Check yesterday's compliance
-                should_check = True
-                end_check = today - timezone.timedelta(days=1)
-                start_check = end_check
-            elif interval == 'WEEKLY' and today.weekday() == 0: # Monday
-                should_check = True
-                end_check = today - timezone.timedelta(days=1) # Sunday
-                start_check = today - timezone.timedelta(days=7) # Preceding Monday
-            elif interval == 'MONTHLY' and today.day == 1: # 1st of month
-                should_check = True
-                # Last month
-                last_month_date = today - timezone.timedelta(days=1)
-                start_check = date(last_month_date.year, last_month_date.month, 1)
-                end_check = last_month_date
-
-            if not should_check and not force:
-                continue
-
-            if force and not should_check:
-                # If forced, calculate periods based on 'today' even if not boundary
                 if interval == 'DAILY':
+                    # Check yesterday's compliance
+                    should_check = True
                     end_check = today - timezone.timedelta(days=1)
                     start_check = end_check
-                elif interval == 'WEEKLY':
-                    # Check the last full week (Mon-Sun)
-                    days_since_monday = today.weekday()
-                    end_check = today - timezone.timedelta(days=days_since_monday + 1)
-                    start_check = end_check - timezone.timedelta(days=6)
-                elif interval == 'MONTHLY':
-                    # Check last calendar month
-                    first_day_this_month = today.replace(day=1)
-                    end_check = first_day_this_month - timezone.timedelta(days=1)
-                    start_check = end_check.replace(day=1)
-
-            # Check all memberships in this group
-            memberships = Membership.objects.filter(group=group).select_related('user')
-            for membership in memberships:
-                user = membership.user
+                elif interval == 'WEEKLY' and today.weekday() == 0: # Monday
+                    should_check = True
+                    end_check = today - timezone.timedelta(days=1) # Sunday
+                    start_check = today - timezone.timedelta(days=7) # Preceding Monday
+                elif interval == 'MONTHLY' and today.day == 1: # 1st of month
+                    should_check = True
+                    # Last month
+                    last_month_date = today - timezone.timedelta(days=1)
+                    start_check = date(last_month_date.year, last_month_date.month, 1)
+                    end_check = last_month_date
+
+                if not should_check and not force:
+                    continue
+
+                if force and not should_check:
+                    # If forced, calculate periods based on 'today' even if not boundary
+                    if interval == 'DAILY':
+                        end_check = today - timezone.timedelta(days=1)
+                        start_check = end_check
+                    elif interval == 'WEEKLY':
+                        # Check the last full week (Mon-Sun)
+                        days_since_monday = today.weekday()
+                        end_check = today - timezone.timedelta(days=days_since_monday + 1)
+                        start_check = end_check - timezone.timedelta(days=6)
+                    elif interval == 'MONTHLY':
+                        # Check last calendar month
+                        first_day_this_month = today.replace(day=1)
+                        end_check = first_day_this_month - timezone.timedelta(days=1)
+                        start_check = end_check.replace(day=1)
+
+                # Check all memberships in this group
+                memberships = Membership.objects.filter(group=group).select_related('user')
+                for membership in memberships:
+                    user = membership.user
                 
-                # Sum PAID contributions in the period
-                total_saved = Contribution.objects.filter(
-                    user=user,
-                    group=group,
-                    status__in=['PAID', 'LATE'],
-                    created_at__date__gte=start_check,
-                    created_at__date__lte=end_check
-                ).aggregate(total=Sum('amount'))['total'] or 0
-
-                if total_saved < group.min_saving_amount:
-                    # Issue penalty if enabled
-                    if group.is_penalty_enabled and membership.is_auto_penalty_enabled:
-                        if not dry_run:
-                            try:
-                                with transaction.atomic():
-                                    reason = f"Missed minimum saving requirement for {interval} period ({start_check} to {end_check}). Required: {group.min_saving_amount}, Saved: {total_saved}"
+                    # Sum PAID contributions in the period
+                    total_saved = Contribution.objects.filter(
+                        user=user,
+                        group=group,
+                        status__in=['PAID', 'LATE'],
+                        created_at__date__gte=start_check,
+                        created_at__date__lte=end_check
+                    ).aggregate(total=Sum('amount'))['total'] or 0
+
+                    if total_saved < group.min_saving_amount:
+                        # Issue penalty if enabled
+                        if group.is_penalty_enabled and membership.is_auto_penalty_enabled:
+                            if not dry_run:
+                                try:
+                                    with transaction.atomic():
+                                        reason = f"Missed minimum saving requirement for {interval} period ({start_check} to {end_check}). Required: {group.min_saving_amount}, Saved: {total_saved}"
                                     
-                                    # Create penalty (standalone or linked to an overdue contribution if any)
-                                    # We'll create it without a specific contribution link if none exists
-                                    Penalty.objects.create(
-                                        user=user,
-                                        amount=group.penalty_amount,
-                                        reason=reason,
-                                    )
+                                        # Create penalty (standalone or linked to an overdue contribution if any)
+                                        # We'll create it without a specific contribution link if none exists
+                                        Penalty.objects.create(
+                                            user=user,
+                                            amount=group.penalty_amount,
+                                            reason=reason,
+                                        )
                                     
-                                    # Send email
-                                    send_penalty_notification_email(
-                                        user, 
-                                        group.penalty_amount, 
-                                        group.name, 
-                                        reason
-                                    )
+                                        # Send email
+                                        send_penalty_notification_email(
+                                            user, 
+                                            group.penalty_amount, 
+                                            group.name, 
+                                            reason
+                                        )
                                     
-                                    # Also create in-app notification
-                                    Notification.objects.create(
-                                        recipient=user,
-                                        type="ERROR",
-                                        title=f"Penalty Issued - {group.name}",
-                                        message=reason
-                                    )
-                                    penalty_count += 1
-                            except Exception as e:
-                                errors.append(f"Penalty error {user.email}: {e}")
-                        else:
-                            penalty_count += 1
+                                        # Also create in-app notification
+                                        Notification.objects.create(
+                                            recipient=user,
+                                            type="ERROR",
+                                            title=f"Penalty Issued - {group.name}",
+                                            message=reason
+                                        )
+                                        penalty_count += 1
+                                except Exception as e:
+                                    errors.append(f"Penalty error {user.email}: {e}")
+                            else:
+                                penalty_count += 1
 
         return penalty_count, errors
@@ -0,0 +1,27 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Contribution, Penalty
+from .services import InsightService
+
+
+@receiver(post_save, sender=Contribution)
+@receiver(post_delete, sender=Contribution)
+def invalidate_contribution_insights(sender, instance, **kwargs):
+    InsightService.invalidate(instance.user_id)
+
+
+@receiver(post_save, sender=Penalty)
+@receiver(post_delete, sender=Penalty)
+def invalidate_penalty_insights(sender, instance, **kwargs):
+    # Contribution-linked penalties may not carry user directly.
+    contribution_user_id = None
+    if Penalty.contribution.is_cached(instance):
+        contribution_user_id = getattr(instance.contribution, "user_id", None)
+    elif instance.contribution_id:
+        contribution_user_id = (
+            Contribution.objects.filter(pk=instance.contribution_id)
+            .values_list("user_id", flat=True)
+            .first()
+        )
+    InsightService.invalidate(instance.user_id, contribution_user_id)
@@ -1,6 +1,8 @@
 from datetime import date, timedelta
 from decimal import Decimal
 
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APITestCase
@@ -8,34 +10,50 @@ from rest_framework_simplejwt.tokens import RefreshToken
 from django.contrib.auth import get_user_model
 
 from groups.models import Group, Membership
-from .models import Contribution, Penalty
+from notifications.models import Notification
+from .models import (
+    AutoSavingConfig,
+    Contribution,
+    Investment,
+    MonthlyContributionRecord,
+    Penalty,
+    SavingsTarget,
+)
+from .report_service import ReportService
 
 User = get_user_model()
 
 
 class AdminAddContributionTests(APITestCase):
-    def setUp(self):
-        self.admin = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        # Clients authenticate with JWTs, so skip password hashing.
+        cls.admin = User.objects.create_user(
             email="finance-admin@test.com",
-            password="AdminPass123!",
+            password=None,
             role="ADMIN",
             is_active=True,
             is_approved=True,
         )
-        self.member = User.objects.create_user(
+        cls.member = User.objects.create_user(
             email="finance-member@test.com",
-            password="MemberPass123!",
+            password=None,
             role="MEMBER",
             is_active=True,
             is_approved=True,
         )
-        self.group = Group.objects.create(
+        cls.group = Group.objects.create(
             name="Savings Group A",
             description="Test group",
-            treasurer=self.admin,
+            treasurer=cls.admin,
+        )
+        cls.membership = Membership.objects.create(
+            user=cls.member,
+            group=cls.group,
+            role="MEMBER",
         )
-        Membership.objects.create(user=self.member, group=self.group, role="MEMBER")
 
+    def setUp(self):
         refresh = RefreshToken.for_user(self.admin)
         self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {refresh.access_token}")
 
@@ -56,6 +74,29 @@ class AdminAddContributionTests(APITestCase):
         self.assertEqual(contribution.status, "PAID")
         self.assertEqual(float(contribution.amount), 1500.0)
 
+    def test_admin_add_contribution_writes_row_once(self):
+        with CaptureQueriesContext(connection) as captured:
+            response = self.client.post(
+                reverse("admin-add-contribution"),
+                {
+                    "user_id": self.member.id,
+                    "group_id": self.group.id,
+                    "amount": "1500.00",
+                },
+                format="json",
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        contribution_writes = [
+            query["sql"]
+            for query in captured.captured_queries
+            if query["sql"].startswith(
+                ('INSERT INTO "finance_contribution"', 'UPDATE "finance_contribution"')
+            )
+        ]
+        self.assertEqual(len(contribution_writes), 1)
+        self.assertTrue(contribution_writes[0].startswith("INSERT"))
+
     def test_added_contribution_reflects_in_member_dashboard_data(self):
         create_url = reverse("admin-add-contribution")
         self.client.post(
@@ -129,6 +170,21 @@ class AdminAddContributionTests(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertIn("group_id", response.data)
 
+    def test_reject_unknown_user_and_group(self):
+        response = self.client.post(
+            reverse("admin-add-contribution"),
+            {
+                "user_id": self.member.id + 1000,
+                "group_id": self.group.id + 1000,
+                "amount": "1000.00",
+            },
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("user_id", response.data)
+        self.assertIn("group_id", response.data)
+
     def test_member_manual_proposal_is_created_as_pending(self):
         member_refresh = RefreshToken.for_user(self.member)
         self.client.credentials(
@@ -197,6 +253,62 @@ class AdminAddContributionTests(APITestCase):
         self.assertEqual(int(stats_after.data["pending_contributions_count"]), 0)
         self.assertEqual(float(stats_after.data["total_savings"]), 1750.0)
 
+    def test_reject_records_review_on_pending_contribution(self):
+        contribution = Contribution.objects.create(
+            user=self.member,
+            group=self.group,
+            amount="900.00",
+            due_date=date.today(),
+            is_manual_entry=True,
+            status="PENDING",
+        )
+
+        response = self.client.post(
+            reverse("contribution-reject", args=[contribution.id]),
+            {"reason": "No matching bank record"},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        contribution.refresh_from_db()
+        self.assertEqual(contribution.status, "REJECTED")
+        self.assertIsNone(contribution.paid_date)
+        self.assertEqual(contribution.reviewed_by, self.admin)
+        self.assertIsNotNone(contribution.reviewed_at)
+        self.assertEqual(contribution.rejection_reason, "No matching bank record")
+
+    def test_approve_persists_cycle_defaults_missing_from_row(self):
+        contribution = Contribution.objects.create(
+            user=self.member,
+            group=self.group,
+            amount="900.00",
+            due_date=date.today(),
+            is_manual_entry=True,
+            status="PENDING",
+        )
+        # Rows written before cycles existed have no cycle or month yet.
+        Contribution.objects.filter(pk=contribution.pk).update(
+            financial_cycle=None,
+            contribution_month=None,
+        )
+
+        response = self.client.post(
+            reverse("contribution-approve", args=[contribution.id]),
+            {},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        contribution.refresh_from_db()
+        self.assertIsNotNone(contribution.financial_cycle_id)
+        self.assertEqual(contribution.contribution_month, date.today().replace(day=1))
+        record = MonthlyContributionRecord.objects.get(
+            user=self.member,
+            group=self.group,
+            month=contribution.contribution_month,
+        )
+        self.assertEqual(record.financial_cycle_id, contribution.financial_cycle_id)
+
     def test_member_cannot_approve_own_pending_contribution(self):
         contribution = Contribution.objects.create(
             user=self.member,
@@ -221,6 +333,73 @@ class AdminAddContributionTests(APITestCase):
         contribution.refresh_from_db()
         self.assertEqual(contribution.status, "PENDING")
 
+    def test_treasurer_cannot_approve_outside_managed_group(self):
+        treasurer = User.objects.create_user(
+            email="finance-other-treasurer@test.com",
+            password=None,
+            role="TREASURER",
+            is_active=True,
+            is_approved=True,
+        )
+        Membership.objects.create(user=treasurer, group=self.group, role="TREASURER")
+        contribution = Contribution.objects.create(
+            user=self.member,
+            group=self.group,
+            amount="900.00",
+            due_date=date.today(),
+            status="PENDING",
+        )
+
+        self.client.force_authenticate(user=treasurer)
+        response = self.client.post(
+            reverse("contribution-approve", args=[contribution.id]),
+            {},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(
+            response.data["detail"], "You can only manage records in your own group."
+        )
+        contribution.refresh_from_db()
+        self.assertEqual(contribution.status, "PENDING")
+
+    def test_archiving_contribution_notifies_group_secretaries(self):
+        secretaries = [
+            User.objects.create_user(
+                email=f"archive-secretary-{index}@test.com",
+                password=None,
+                role="FINANCIAL_SECRETARY",
+                is_active=True,
+                is_approved=True,
+            )
+            for index in range(2)
+        ]
+        for secretary in secretaries:
+            Membership.objects.create(user=secretary, group=self.group, role="FINANCIAL_SECRETARY")
+        contribution = Contribution.objects.create(
+            user=self.member,
+            group=self.group,
+            amount="1200.00",
+            due_date=date.today(),
+            status="PAID",
+            paid_date=date.today(),
+        )
+
+        response = self.client.delete(
+            reverse("contribution-detail", args=[contribution.id]),
+            {"reason": "Duplicate entry"},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertCountEqual(
+            Notification.objects.filter(title="Financial Record Archived").values_list(
+                "recipient_id", flat=True
+            ),
+            [secretary.id for secretary in secretaries],
+        )
+
     def test_member_cannot_delete_contribution(self):
         contribution = Contribution.objects.create(
             user=self.member,
@@ -281,6 +460,31 @@ class AdminAddContributionTests(APITestCase):
             1,
         )
 
+    def test_reset_can_return_member_to_review(self):
+        response = self.client.post(
+            reverse("admin-reset-member-finance"),
+            {"user_id": self.member.id, "reset_account_status": True},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.member.refresh_from_db()
+        self.assertFalse(self.member.is_approved)
+        self.assertEqual(self.member.application_status, "UNDER_REVIEW")
+        self.assertIsNone(self.member.membership_number)
+
+    def test_member_cannot_reset_financial_account(self):
+        self.client.force_authenticate(user=self.member)
+
+        response = self.client.post(
+            reverse("admin-reset-member-finance"),
+            {"user_id": self.member.id},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(response.data["detail"], "Only admins can perform this action.")
+
 
 class AdminMemberFinancialOversightTests(APITestCase):
     def setUp(self):
@@ -386,6 +590,22 @@ class AdminMemberFinancialOversightTests(APITestCase):
         self.assertEqual(member_two_payload["paid_contributions_count"], 1)
         self.assertEqual(float(member_two_payload["savings_balance"]), 800.0)
 
+    def test_admin_member_list_pages_with_cursor_when_requested(self):
+        url = reverse("admin-member-list")
+        first = self.client.get(url, {"group_id": self.group.id, "page_size": 1})
+
+        self.assertEqual(first.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(first.data["results"]), 1)
+        self.assertIsNotNone(first.data["next"])
+
+        second = self.client.get(first.data["next"])
+        self.assertEqual(len(second.data["results"]), 1)
+        self.assertIsNone(second.data["next"])
+        self.assertNotEqual(
+            first.data["results"][0]["user_id"],
+            second.data["results"][0]["user_id"],
+        )
+
     def test_admin_group_summary_uses_group_scoped_financial_totals(self):
         response = self.client.get(
             reverse("admin-group-summary"),
@@ -398,6 +618,31 @@ class AdminMemberFinancialOversightTests(APITestCase):
         self.assertEqual(float(stats["total_savings"]), 1800.0)
         self.assertEqual(float(stats["total_penalties"]), 120.0)
 
+    def test_treasurer_report_summary_is_scoped_to_managed_group(self):
+        treasurer = User.objects.create_user(
+            email="oversight-treasurer@test.com",
+            password="TreasurerPass123!",
+            role="TREASURER",
+            is_active=True,
+            is_approved=True,
+        )
+        managed = Group.objects.create(name="Managed", treasurer=treasurer)
+        self.client.force_authenticate(user=treasurer)
+        url = reverse("financial-report-summary")
+
+        self.assertEqual(
+            self.client.get(url, {"group_id": managed.id}).status_code,
+            status.HTTP_200_OK,
+        )
+        self.assertEqual(
+            self.client.get(url, {"group_id": self.group.id}).status_code,
+            status.HTTP_403_FORBIDDEN,
+        )
+        self.assertEqual(
+            self.client.get(url, {"group_id": managed.id + 1000}).status_code,
+            status.HTTP_404_NOT_FOUND,
+        )
+
 
 class PenaltyEndpointTests(APITestCase):
     def setUp(self):
@@ -453,3 +698,292 @@ class PenaltyEndpointTests(APITestCase):
         self.assertEqual(response.data[0]["status"], "UNPAID")
         self.assertEqual(response.data[0]["user_name"], "Penalty Member")
         self.assertEqual(response.data[0]["group_name"], "Penalty Group")
+
+    def test_penalty_create_syncs_linked_contribution(self):
+        contribution = Contribution.objects.create(
+            user=self.member,
+            group=self.group,
+            amount=Decimal("1200.00"),
+            due_date=date.today(),
+            status="PENDING",
+        )
+
+        self.client.force_authenticate(user=self.admin)
+        with CaptureQueriesContext(connection) as captured:
+            response = self.client.post(
+                reverse("penalty-list"),
+                {
+                    "contribution": contribution.id,
+                    "amount": "150.00",
+                    "reason": "Late submission",
+                },
+                format="json",
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["group_name"], "Penalty Group")
+        # Group and member come with the contribution lookup.
+        lazy_loads = [
+            query["sql"]
+            for query in captured.captured_queries
+            if query["sql"].startswith("SELECT")
+            and ('FROM "groups_group"' in query["sql"] or 'FROM "accounts_user"' in query["sql"])
+        ]
+        self.assertEqual(lazy_loads, [])
+        contribution.refresh_from_db()
+        self.assertEqual(contribution.penalty, Decimal("150.00"))
+        penalty = Penalty.objects.get(contribution=contribution)
+        self.assertEqual(penalty.user, self.member)
+        self.assertEqual(penalty.applied_by, self.admin)
+
+    def test_treasurer_penalty_create_is_scoped_to_managed_groups(self):
+        treasurer = User.objects.create_user(
+            email="penalty-create-treasurer@test.com",
+            password="TreasurerPass123!",
+            role="TREASURER",
+            is_active=True,
+            is_approved=True,
+        )
+        managed_group = Group.objects.create(
+            name="Managed Penalty Group",
+            description="Treasurer-managed group",
+            treasurer=treasurer,
+        )
+        Membership.objects.create(user=self.member, group=managed_group, role="MEMBER")
+        managed = Contribution.objects.create(
+            user=self.member,
+            group=managed_group,
+            amount=Decimal("1000.00"),
+            due_date=date.today(),
+            status="PENDING",
+        )
+        foreign = Contribution.objects.create(
+            user=self.member,
+            group=self.group,
+            amount=Decimal("1000.00"),
+            due_date=date.today(),
+            status="PENDING",
+        )
+
+        self.client.force_authenticate(user=treasurer)
+        url = reverse("penalty-list")
+        payload = {"amount": "50.00", "reason": "Late submission"}
+
+        response = self.client.post(url, {**payload, "contribution": managed.id}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        response = self.client.post(url, {**payload, "contribution": foreign.id}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertFalse(Penalty.objects.filter(contribution=foreign).exists())
+
+    def test_member_cannot_create_penalty(self):
+        self.client.force_authenticate(user=self.member)
+        response = self.client.post(
+            reverse("penalty-list"),
+            {"user": self.member.id, "amount": "50.00", "reason": "Self-issued"},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertFalse(Penalty.objects.filter(user=self.member).exists())
+
+    def test_treasurer_penalty_list_covers_standalone_penalties(self):
+        treasurer = User.objects.create_user(
+            email="penalty-treasurer@test.com",
+            password="TreasurerPass123!",
+            role="TREASURER",
+            is_active=True,
+            is_approved=True,
+        )
+        Membership.objects.create(user=treasurer, group=self.group, role="TREASURER")
+        Penalty.objects.create(
+            user=self.member,
+            amount=Decimal("75.00"),
+            reason="Standalone penalty",
+            applied_by=self.admin,
+        )
+
+        self.client.force_authenticate(user=treasurer)
+        response = self.client.get(reverse("penalty-list"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 1)
+        self.assertEqual(response.data[0]["group_name"], "Penalty Group")
+
+
+    def test_treasurer_penalty_list_has_no_duplicates_across_groups(self):
+        treasurer = User.objects.create_user(
+            email="penalty-multi-treasurer@test.com",
+            password="TreasurerPass123!",
+            role="TREASURER",
+            is_active=True,
+            is_approved=True,
+        )
+        second_group = Group.objects.create(
+            name="Second Penalty Group",
+            description="Second penalty test group",
+            treasurer=treasurer,
+        )
+        Membership.objects.create(user=self.member, group=second_group, role="MEMBER")
+        for group in (self.group, second_group):
+            Membership.objects.create(user=treasurer, group=group, role="TREASURER")
+        Penalty.objects.create(
+            user=self.member,
+            amount=Decimal("75.00"),
+            reason="Standalone penalty",
+            applied_by=self.admin,
+        )
+
+        self.client.force_authenticate(user=treasurer)
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(reverse("penalty-list"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 1)
+        self.assertFalse(any("DISTINCT" in query["sql"] for query in ctx.captured_queries))
+
+
+class FinanceQueryBudgetTests(APITestCase):
+    """
+    Pin the number of queries issued by the hot finance read paths so that
+    N+1 regressions fail CI instead of surfacing in production.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        # Clients authenticate with force_authenticate, so skip password hashing.
+        cls.admin = User.objects.create_user(
+            email="budget-admin@test.com",
+            password=None,
+            role="ADMIN",
+            is_active=True,
+            is_approved=True,
+        )
+        cls.members = [
+            User.objects.create_user(
+                email=f"budget-member-{index}@test.com",
+                password=None,
+                role="MEMBER",
+                first_name="Budget",
+                last_name=f"Member{index}",
+                is_active=True,
+                is_approved=True,
+            )
+            for index in range(3)
+        ]
+        cls.saver = cls.members[0]
+        cls.group = Group.objects.create(
+            name="Budget Group",
+            description="Query budget test group",
+            treasurer=cls.admin,
+        )
+        today = date.today()
+        for member in cls.members:
+            Membership.objects.create(user=member, group=cls.group, role="MEMBER")
+            contribution = Contribution.objects.create(
+                user=member,
+                group=cls.group,
+                amount=Decimal("1000.00"),
+                due_date=today,
+                paid_date=today,
+            )
+            Penalty.objects.create(
+                user=member,
+                contribution=contribution,
+                amount=Decimal("50.00"),
+                reason="Budget penalty",
+                applied_by=cls.admin,
+            )
+            # Owned resources all belong to one saver so their list
+            # endpoints return several rows.
+            AutoSavingConfig.objects.create(
+                user=cls.saver,
+                group=cls.group,
+                amount=Decimal("1000.00"),
+                is_active=member == cls.saver,
+            )
+            SavingsTarget.objects.create(
+                user=cls.saver,
+                group=cls.group,
+                name=f"Budget Goal {member.pk}",
+                target_amount=Decimal("10000.00"),
+                start_date=today - timedelta(days=30),
+            )
+            Investment.objects.create(
+                group=cls.group,
+                name=f"Budget Investment {member.pk}",
+                amount_invested=Decimal("5000.00"),
+                expected_roi_percentage=Decimal("10.00"),
+                start_date=today,
+                created_by=cls.admin,
+            )
+
+    def setUp(self):
+        self.client.force_authenticate(user=self.admin)
+
+    def test_monthly_summary_query_count(self):
+        today = date.today()
+        with self.assertNumQueries(4):
+            ReportService.get_monthly_summary(self.group.id, today.year, today.month)
+
+    def test_contribution_list_query_count(self):
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse("contribution-list"))
+        self.assertEqual(len(response.data), 3)
+
+    def test_penalty_list_query_count(self):
+        with self.assertNumQueries(3):
+            response = self.client.get(reverse("penalty-list"))
+        self.assertEqual(len(response.data), 3)
+
+    def test_standalone_penalty_list_query_count(self):
+        Penalty.objects.update(contribution=None)
+        with self.assertNumQueries(3):
+            response = self.client.get(reverse("penalty-list"))
+        self.assertEqual(len(response.data), 3)
+        self.assertEqual({row["group_name"] for row in response.data}, {"Budget Group"})
+
+    def test_auto_saving_list_query_count(self):
+        self.client.force_authenticate(user=self.saver)
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse("auto-saving-list"))
+        self.assertEqual(len(response.data), 3)
+
+    def test_savings_target_list_query_count(self):
+        self.client.force_authenticate(user=self.saver)
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse("savings-target-list"))
+        self.assertEqual(len(response.data), 3)
+
+    def test_investment_list_query_count(self):
+        with self.assertNumQueries(3):
+            response = self.client.get(reverse("investment-list"))
+        self.assertEqual(len(response.data), 3)
+
+    def test_admin_member_list_query_count(self):
+        with self.assertNumQueries(1):
+            response = self.client.get(
+                reverse("admin-member-list"),
+                {"group_id": self.group.id},
+            )
+        self.assertEqual(len(response.data), 3)
+
+    def test_contribution_detail_query_count(self):
+        contribution = Contribution.objects.filter(user=self.saver).first()
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse("contribution-detail", args=[contribution.pk]))
+        self.assertEqual(response.data["id"], contribution.pk)
+
+    def test_contribution_approve_loads_relations_with_contribution(self):
+        contribution = Contribution.objects.filter(user=self.saver).first()
+        Contribution.objects.filter(pk=contribution.pk).update(status="PENDING", paid_date=None)
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.post(reverse("contribution-approve", args=[contribution.pk]))
+
+        self.assertEqual(response.status_code, 200)
+        group_lookups = [
+            query["sql"] for query in ctx.captured_queries
+            if query["sql"].startswith('SELECT "groups_group"')
+        ]
+        self.assertEqual(group_lookups, [])
@@ -14,6 +14,9 @@ from django.contrib.auth import get_user_model
 from rest_framework.test import APITestCase
 from rest_framework import status
 
+from finance.management.commands.generate_monthly_contributions import (
+    run as generate_monthly_contributions,
+)
 from finance.models import (
     AutoSavingConfig,
     MonthlySavingGeneration,
@@ -31,20 +34,26 @@ User = get_user_model()
 # Model Tests
 # =========================
 class AutoSavingConfigModelTests(TestCase):
-    def setUp(self):
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        # Model tests never log in, so skip password hashing.
+        cls.user = User.objects.create_user(
             email="saver@test.com",
-            password="testpass123",
+            password=None,
             first_name="Test",
             last_name="Saver",
             is_active=True,
             is_approved=True,
         )
-        self.group = Group.objects.create(
+        cls.group = Group.objects.create(
             name="Test Savings Group",
-            treasurer=self.user,
+            treasurer=cls.user,
+        )
+        cls.membership = Membership.objects.create(
+            user=cls.user,
+            group=cls.group,
+            role="MEMBER",
         )
-        Membership.objects.create(user=self.user, group=self.group, role="MEMBER")
 
     def test_create_auto_saving_config(self):
         """Test creating a valid auto-saving config."""
@@ -71,20 +80,26 @@ class AutoSavingConfigModelTests(TestCase):
 
 
 class SavingsTargetModelTests(TestCase):
-    def setUp(self):
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        # Model tests never log in, so skip password hashing.
+        cls.user = User.objects.create_user(
             email="target@test.com",
-            password="testpass123",
+            password=None,
             first_name="Target",
             last_name="User",
             is_active=True,
             is_approved=True,
         )
-        self.group = Group.objects.create(
+        cls.group = Group.objects.create(
             name="Target Test Group",
-            treasurer=self.user,
+            treasurer=cls.user,
+        )
+        cls.membership = Membership.objects.create(
+            user=cls.user,
+            group=cls.group,
+            role="MEMBER",
         )
-        Membership.objects.create(user=self.user, group=self.group, role="MEMBER")
 
     def test_create_savings_target(self):
         """Test creating a savings target."""
@@ -139,8 +154,9 @@ class SavingsTargetModelTests(TestCase):
 # API Tests
 # =========================
 class AutoSavingConfigAPITests(APITestCase):
-    def setUp(self):
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             email="api@test.com",
             password="testpass123",
             first_name="API",
@@ -148,16 +164,19 @@ class AutoSavingConfigAPITests(APITestCase):
             is_active=True,
             is_approved=True,
         )
-        self.group = Group.objects.create(
+        cls.group = Group.objects.create(
             name="API Test Group",
-            treasurer=self.user,
+            treasurer=cls.user,
         )
-        Membership.objects.create(user=self.user, group=self.group, role="MEMBER")
+        Membership.objects.create(user=cls.user, group=cls.group, role="MEMBER")
+        cls.list_url = reverse("auto-saving-list")
+
+    def setUp(self):
         self.client.force_authenticate(user=self.user)
 
     def test_create_auto_saving_config(self):
         """Test creating auto-saving config via API."""
-        url = reverse("auto-saving-list")
+        url = self.list_url
         data = {
             "group": self.group.id,
             "amount": "1000.00",
@@ -170,7 +189,7 @@ class AutoSavingConfigAPITests(APITestCase):
 
     def test_create_config_below_minimum_fails(self):
         """Test that amount below 500 is rejected."""
-        url = reverse("auto-saving-list")
+        url = self.list_url
         data = {
             "group": self.group.id,
             "amount": "100.00",
@@ -180,6 +199,43 @@ class AutoSavingConfigAPITests(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertIn("amount", str(response.data).lower())
 
+    def test_create_config_with_invalid_day_fails(self):
+        """Test that day_of_month outside 1-28 is rejected."""
+        url = self.list_url
+        data = {
+            "group": self.group.id,
+            "amount": "1000.00",
+            "is_active": True,
+            "day_of_month": 30,
+        }
+        response = self.client.post(url, data)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.data["day_of_month"],
+            ["Day of month must be between 1 and 28"],
+        )
+
+    def test_second_active_config_for_group_fails(self):
+        """Test that the active-config constraint surfaces as a 400."""
+        AutoSavingConfig.objects.create(
+            user=self.user,
+            group=self.group,
+            amount=Decimal("500.00"),
+        )
+        url = self.list_url
+        data = {
+            "group": self.group.id,
+            "amount": "1000.00",
+            "is_active": True,
+        }
+        response = self.client.post(url, data)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("group", response.data)
+        self.assertEqual(
+            AutoSavingConfig.objects.filter(user=self.user, group=self.group).count(),
+            1,
+        )
+
     def test_list_user_configs(self):
         """Test listing user's own configs."""
         AutoSavingConfig.objects.create(
@@ -187,7 +243,7 @@ class AutoSavingConfigAPITests(APITestCase):
             group=self.group,
             amount=Decimal("500.00"),
         )
-        url = reverse("auto-saving-list")
+        url = self.list_url
         response = self.client.get(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.data), 1)
@@ -207,8 +263,9 @@ class AutoSavingConfigAPITests(APITestCase):
 
 
 class SavingsTargetAPITests(APITestCase):
-    def setUp(self):
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             email="targetapi@test.com",
             password="testpass123",
             first_name="Target",
@@ -216,16 +273,19 @@ class SavingsTargetAPITests(APITestCase):
             is_active=True,
             is_approved=True,
         )
-        self.group = Group.objects.create(
+        cls.group = Group.objects.create(
             name="Target API Group",
-            treasurer=self.user,
+            treasurer=cls.user,
         )
-        Membership.objects.create(user=self.user, group=self.group, role="MEMBER")
+        Membership.objects.create(user=cls.user, group=cls.group, role="MEMBER")
+        cls.list_url = reverse("savings-target-list")
+
+    def setUp(self):
         self.client.force_authenticate(user=self.user)
 
     def test_create_savings_target(self):
         """Test creating a savings target via API."""
-        url = reverse("savings-target-list")
+        url = self.list_url
         data = {
             "group": self.group.id,
             "name": "Emergency Fund",
@@ -263,13 +323,41 @@ class SavingsTargetAPITests(APITestCase):
         self.assertEqual(response.data["total_saved"], "5000.00")
         self.assertEqual(response.data["progress_percent"], "50.00")
 
+    def test_update_response_reflects_new_start_date(self):
+        target = SavingsTarget.objects.create(
+            user=self.user,
+            group=self.group,
+            name="Moved Target",
+            target_amount=Decimal("1000.00"),
+            start_date=date.today(),
+        )
+        Contribution.objects.create(
+            user=self.user,
+            group=self.group,
+            amount=Decimal("500.00"),
+            due_date=date.today() - timedelta(days=10),
+            paid_date=date.today() - timedelta(days=10),
+            status="PAID",
+        )
+
+        url = reverse("savings-target-detail", args=[target.id])
+        response = self.client.patch(
+            url,
+            {"start_date": str(date.today() - timedelta(days=30))},
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["total_saved"], "500.00")
+        self.assertEqual(response.data["progress_percent"], "50.00")
+
 
 # =========================
 # Management Command Tests
 # =========================
 class GenerateMonthlyContributionsTests(TestCase):
-    def setUp(self):
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             email="cmd@test.com",
             password="testpass123",
             first_name="Command",
@@ -277,11 +365,11 @@ class GenerateMonthlyContributionsTests(TestCase):
             is_active=True,
             is_approved=True,
         )
-        self.group = Group.objects.create(
+        cls.group = Group.objects.create(
             name="Command Test Group",
-            treasurer=self.user,
+            treasurer=cls.user,
         )
-        Membership.objects.create(user=self.user, group=self.group, role="MEMBER")
+        Membership.objects.create(user=cls.user, group=cls.group, role="MEMBER")
 
     def test_generates_contribution_for_active_config(self):
         """Test that command generates contributions for active configs."""
@@ -298,7 +386,7 @@ class GenerateMonthlyContributionsTests(TestCase):
         # Check contribution was created
         contributions = Contribution.objects.filter(user=self.user, group=self.group)
         self.assertEqual(contributions.count(), 1)
-        self.assertEqual(contributions.first().amount, Decimal("1000.00"))
+        self.assertEqual(contributions.values_list("amount", flat=True).first(), Decimal("1000.00"))
         
         # Check audit record was created
         generations = MonthlySavingGeneration.objects.all()
@@ -308,6 +396,39 @@ class GenerateMonthlyContributionsTests(TestCase):
         notifications = Notification.objects.filter(recipient=self.user)
         self.assertTrue(notifications.exists())
 
+    def test_bulk_generation_applies_contribution_defaults(self):
+        """Bulk-inserted contributions get the same defaults as save()."""
+        other = User.objects.create_user(
+            email="cmd-other@test.com",
+            password="testpass123",
+            is_active=True,
+            is_approved=True,
+        )
+        Membership.objects.create(user=other, group=self.group, role="MEMBER")
+        for member in (self.user, other):
+            AutoSavingConfig.objects.create(
+                user=member,
+                group=self.group,
+                amount=Decimal("1000.00"),
+                is_active=True,
+            )
+
+        self.assertEqual(generate_monthly_contributions(), (2, 0))
+
+        contributions = Contribution.objects.filter(group=self.group)
+        self.assertEqual(contributions.count(), 2)
+        self.assertEqual(
+            len({contribution.financial_cycle_id for contribution in contributions}), 1
+        )
+        for contribution in contributions:
+            self.assertIsNotNone(contribution.financial_cycle_id)
+            self.assertEqual(contribution.contribution_month, contribution.due_date.replace(day=1))
+            self.assertEqual(contribution.status, "PENDING")
+        self.assertEqual(
+            MonthlySavingGeneration.objects.filter(contribution__in=contributions).count(), 2
+        )
+        self.assertEqual(Notification.objects.filter(title="Monthly Auto-Save Scheduled").count(), 2)
+
     def test_skips_inactive_configs(self):
         """Test that inactive configs are skipped."""
         AutoSavingConfig.objects.create(
@@ -332,9 +453,9 @@ class GenerateMonthlyContributionsTests(TestCase):
             is_active=True,
         )
         
-        # Run command twice
-        call_command("generate_monthly_contributions", stdout=StringIO())
-        call_command("generate_monthly_contributions", stdout=StringIO())
+        # Run generation twice
+        self.assertEqual(generate_monthly_contributions(), (1, 0))
+        self.assertEqual(generate_monthly_contributions(), (0, 1))
         
         # Should only have one contribution
         contributions = Contribution.objects.filter(user=self.user, group=self.group)
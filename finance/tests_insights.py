@@ -1,8 +1,10 @@
+from django.core.cache import cache
 from django.urls import reverse
 from rest_framework.test import APITestCase
 from rest_framework import status
 from django.contrib.auth import get_user_model
 from .models import Contribution, Penalty
+from .services import InsightService
 from groups.models import Group
 from decimal import Decimal
 from datetime import date, timedelta
@@ -11,8 +13,9 @@ User = get_user_model()
 
 
 class FinancialInsightsTests(APITestCase):
-    def setUp(self):
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             email="insights@seedvest.com",
             password="pass123",
             first_name="Insight",
@@ -20,9 +23,11 @@ class FinancialInsightsTests(APITestCase):
             is_active=True,
             is_approved=True,
         )
+        cls.group = Group.objects.create(name="Insight Group", treasurer=cls.user)
+
+    def setUp(self):
+        cache.clear()
         self.client.force_authenticate(user=self.user)
-        
-        self.group = Group.objects.create(name="Insight Group", treasurer=self.user)
 
     def test_insights_generation_perfect_record(self):
         # Create perfect history
@@ -80,3 +85,64 @@ class FinancialInsightsTests(APITestCase):
         recommendations = data["recommendations"]
         self.assertTrue(any(r["type"] == "WARNING" for r in recommendations))
         self.assertTrue(any(r["type"] == "TIP" for r in recommendations))
+
+    def test_insights_summary_uses_two_queries(self):
+        Contribution.objects.create(
+            user=self.user,
+            group=self.group,
+            amount=Decimal("100.00"),
+            due_date=date.today() + timedelta(days=10),
+            status="PENDING"
+        )
+
+        with self.assertNumQueries(2):
+            summary = InsightService(self.user).get_insights()["summary"]
+
+        self.assertEqual(summary["pending_contributions"], 1)
+        self.assertEqual(summary["overdue_contributions"], 0)
+        self.assertEqual(summary["total_contributed"], 0)
+
+    def test_insights_skip_penalty_query_without_contributions(self):
+        with self.assertNumQueries(1):
+            summary = InsightService(self.user).get_insights()["summary"]
+
+        self.assertEqual(summary["total_penalties_paid"], 0)
+        self.assertEqual(summary["total_contributed"], 0)
+
+    def test_insights_are_cached_until_contributions_change(self):
+        url = reverse("financial-insights")
+        self.client.get(url)
+
+        with self.assertNumQueries(0):
+            self.client.get(url)
+
+        Contribution.objects.create(
+            user=self.user,
+            group=self.group,
+            amount=Decimal("250.00"),
+            due_date=date.today() - timedelta(days=5),
+            paid_date=date.today() - timedelta(days=6),
+            status="PAID"
+        )
+        response = self.client.get(url)
+        self.assertEqual(response.data["summary"]["total_contributed"], 250.0)
+
+    def test_insights_answer_not_modified_for_matching_etag(self):
+        url = reverse("financial-insights")
+        first = self.client.get(url)
+        self.assertEqual(first.status_code, status.HTTP_200_OK)
+        etag = first["ETag"]
+
+        cached = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(cached.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        Contribution.objects.create(
+            user=self.user,
+            group=self.group,
+            amount=Decimal("100.00"),
+            due_date=date.today(),
+            status="PENDING",
+        )
+        refreshed = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(refreshed.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(refreshed["ETag"], etag)
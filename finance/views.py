@@ -2,7 +2,7 @@ import csv
 from datetime import date
 from io import StringIO
 
-from django.db import models, transaction
+from django.db import transaction
 from django.db.models import (
     Sum,
     Q,
@@ -13,6 +13,7 @@ from django.db.models import (
     When,
     F,
     OuterRef,
+    Prefetch,
     Subquery,
     DecimalField,
     IntegerField,
@@ -29,12 +30,17 @@ from rest_framework.views import APIView
 from rest_framework.generics import ListAPIView
 from django.utils import timezone
 from django.http import HttpResponse
+from django.utils.http import parse_etags, quote_etag
+from accounts.emails import send_investment_status_email
 from accounts.models import AuditLog, User
 from notifications.models import Notification
+from seedvest.pagination import OptInCursorPagination
 
 from accounts.permissions import IsApprovedUser
 from finance.permissions import (
     HasFinanceAccess,
+    IsAdminOrGroupTreasurer,
+    IsFinanceAdmin,
     PenaltyPermission,
     IsTreasurerOrAdmin,
     IsTreasurerOrAdminOrFinancialSecretaryReadOnly,
@@ -42,6 +48,7 @@ from finance.permissions import (
     IsGroupMember,
 )
 from groups.models import Group, Membership
+from groups.utils import get_request_treasurer_group_ids
 from .models import (
     Contribution,
     Penalty,
@@ -81,35 +88,99 @@ from .cycle_services import FinancialCycleService, FinancialDataAuditService
 from .report_service import ReportService
 
 
+# Columns Contribution.prepare_for_save() can change on a review.
+REVIEW_DERIVED_FIELDS = (
+    "financial_cycle",
+    "contribution_month",
+    "expected_amount",
+    "penalty",
+)
+
+
+def _user_group_ids(user):
+    return user.membership_set.values_list("group_id", flat=True)
+
+
+def _scope_by_role(queryset, user, role_filters):
+    """Narrow ``queryset`` to what ``user`` may see using a per-role Q table."""
+    if user.is_superuser:
+        return queryset
+    role_filter = role_filters.get(user.role)
+    if role_filter is None:
+        return queryset.none()
+    return queryset.filter(role_filter(user))
+
+
+# Relations the contribution detail actions (approve/reject/update/destroy)
+# read: the group for treasurer checks, the member for audit logs and the
+# cycle for totals refresh.
+CONTRIBUTION_DETAIL_RELATED = ("group", "user", "financial_cycle")
+
+# Row visibility per role. Treasurers and secretaries see their groups'
+# records; members see their own.
+CONTRIBUTION_ROLE_FILTERS = {
+    "ADMIN": lambda user: Q(),
+    "TREASURER": lambda user: Q(group_id__in=_user_group_ids(user)),
+    "FINANCIAL_SECRETARY": lambda user: Q(group_id__in=_user_group_ids(user)),
+    "MEMBER": lambda user: Q(user=user),
+}
+
+
+def _penalty_group_filter(user):
+    # Standalone penalties have no contribution; match them through the
+    # penalised member's memberships with a subquery so no DISTINCT is needed.
+    group_ids = _user_group_ids(user)
+    return Q(contribution__group_id__in=group_ids) | Q(
+        user_id__in=Membership.objects.filter(group_id__in=group_ids).values("user_id")
+    )
+
+
+PENALTY_ROLE_FILTERS = {
+    "ADMIN": lambda user: Q(),
+    "TREASURER": _penalty_group_filter,
+    "FINANCIAL_SECRETARY": _penalty_group_filter,
+    "MEMBER": lambda user: Q(user=user, is_archived=False),
+}
+
+INVESTMENT_ROLE_FILTERS = {
+    "ADMIN": lambda user: Q(),
+    "TREASURER": lambda user: Q(group_id__in=_user_group_ids(user)),
+    "FINANCIAL_SECRETARY": lambda user: Q(group_id__in=_user_group_ids(user)),
+    "MEMBER": lambda user: Q(created_by=user),
+}
+
+
 class ContributionViewSet(viewsets.ModelViewSet):
+    serializer_class = ContributionSerializer
+    serializer_classes = {
+        "create": ManualContributionProposalSerializer,
+    }
+
     def get_permissions(self):
         permissions = [IsAuthenticated(), IsApprovedUser()]
         if self.action == "create":
             permissions.append(HasFinanceAccess())
+        elif self.action in ("approve", "reject", "destroy"):
+            permissions.append(IsAdminOrGroupTreasurer())
         return permissions
 
     def get_serializer_class(self):
-        if self.action == "create":
-            return ManualContributionProposalSerializer
-        return ContributionSerializer
+        return self.serializer_classes.get(self.action, self.serializer_class)
 
     def get_queryset(self):
         user = self.request.user
+        queryset = Contribution.objects.filter(is_archived=False)
 
-        if user.is_superuser or user.role == "ADMIN":
-            return Contribution.objects.filter(is_archived=False)
+        # ContributionSerializer only renders local columns, so list responses
+        # stay join-free; the detail actions read group, user and cycle.
+        if self.action != "list":
+            queryset = queryset.select_related(*CONTRIBUTION_DETAIL_RELATED)
 
-        if user.role in ["TREASURER", "FINANCIAL_SECRETARY"]:
-            user_groups = user.membership_set.values_list('group_id', flat=True)
-            return Contribution.objects.filter(group_id__in=user_groups, is_archived=False)
-
-        if user.role == "MEMBER":
-            return Contribution.objects.filter(user=user, is_archived=False)
-
-        return Contribution.objects.none()
+        return _scope_by_role(queryset, user, CONTRIBUTION_ROLE_FILTERS)
 
     def perform_create(self, serializer):
-        serializer.save(user=self.request.user)
+        contribution = serializer.save(user=self.request.user)
+        FinancialCycleService.sync_monthly_record_from_contribution(contribution)
 
     def perform_update(self, serializer):
         instance = self.get_object()
@@ -141,37 +212,30 @@ class ContributionViewSet(viewsets.ModelViewSet):
             if contribution.financial_cycle:
                 contribution.financial_cycle.refresh_totals()
 
-    def create(self, request, *args, **kwargs):
-        serializer = self.get_serializer(data=request.data)
-        serializer.is_valid(raise_exception=True)
-        contribution = serializer.save(user=request.user)
-        FinancialCycleService.sync_monthly_record_from_contribution(contribution)
-        data = ContributionSerializer(
-            contribution,
-            context=self.get_serializer_context(),
-        ).data
-        headers = self.get_success_headers(data)
-        return Response(data, status=status.HTTP_201_CREATED, headers=headers)
+    @staticmethod
+    def _apply_review(contribution, changes):
+        """
+        Persist a review decision with a single UPDATE of the touched columns
+        instead of a full save(). The in-memory instance is kept in sync for
+        the monthly record sync that follows.
+        """
+        for field, value in changes.items():
+            setattr(contribution, field, value)
+        contribution.prepare_for_save(skip_status_evaluation=True)
+        # prepare_for_save() may also fill in cycle defaults and the
+        # suggested penalty; write those too so the monthly record sync
+        # below never sees values the row doesn't have.
+        for field in REVIEW_DERIVED_FIELDS:
+            changes[field] = getattr(contribution, field)
+
+        Contribution.objects.filter(pk=contribution.pk).update(**changes)
+        # update() sends no post_save, so evict cached insights here.
+        InsightService.invalidate(contribution.user_id)
 
     @action(detail=True, methods=["post"])
     def approve(self, request, pk=None):
         user = request.user
-        if user.role not in ("ADMIN", "TREASURER") and not user.is_superuser:
-            return Response(
-                {"detail": "Only admins and treasurers can approve contributions."},
-                status=status.HTTP_403_FORBIDDEN,
-            )
-
         contribution = self.get_object()
-        if (
-            user.role == "TREASURER"
-            and not user.is_superuser
-            and contribution.group.treasurer_id != user.id
-        ):
-            return Response(
-                {"detail": "You can only approve contributions in your own group."},
-                status=status.HTTP_403_FORBIDDEN,
-            )
 
         if contribution.status != "PENDING":
             return Response(
@@ -184,39 +248,27 @@ class ContributionViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        paid_date = contribution.reported_paid_date or timezone.now().date()
+        now = timezone.now()
+        paid_date = contribution.reported_paid_date or now.date()
+        changes = {
+            "status": "PAID",
+            "paid_date": paid_date,
+            "reviewed_by": user,
+            "reviewed_at": now,
+            "rejection_reason": "",
+        }
         if contribution.is_manual_entry:
             # Keep approved manual entries marked as paid instead of late/overdue.
-            contribution.due_date = paid_date
-
-        contribution.status = "PAID"
-        contribution.paid_date = paid_date
-        contribution.reviewed_by = user
-        contribution.reviewed_at = timezone.now()
-        contribution.rejection_reason = ""
-        contribution.save(skip_status_evaluation=True)
+            changes["due_date"] = paid_date
+
+        self._apply_review(contribution, changes)
         FinancialCycleService.sync_monthly_record_from_contribution(contribution)
         return Response({"status": "Contribution approved and marked as paid"})
 
     @action(detail=True, methods=["post"])
     def reject(self, request, pk=None):
         user = request.user
-        if user.role not in ("ADMIN", "TREASURER") and not user.is_superuser:
-            return Response(
-                {"detail": "Only admins and treasurers can reject contributions."},
-                status=status.HTTP_403_FORBIDDEN,
-            )
-
         contribution = self.get_object()
-        if (
-            user.role == "TREASURER"
-            and not user.is_superuser
-            and contribution.group.treasurer_id != user.id
-        ):
-            return Response(
-                {"detail": "You can only reject contributions in your own group."},
-                status=status.HTTP_403_FORBIDDEN,
-            )
 
         if contribution.status != "PENDING":
             return Response(
@@ -235,12 +287,16 @@ class ContributionViewSet(viewsets.ModelViewSet):
                 {"reason": "Rejection reason is required."},
                 status=status.HTTP_400_BAD_REQUEST,
             )
-        contribution.status = "REJECTED"
-        contribution.paid_date = None
-        contribution.reviewed_by = user
-        contribution.reviewed_at = timezone.now()
-        contribution.rejection_reason = reason
-        contribution.save(skip_status_evaluation=True)
+        self._apply_review(
+            contribution,
+            {
+                "status": "REJECTED",
+                "paid_date": None,
+                "reviewed_by": user,
+                "reviewed_at": timezone.now(),
+                "rejection_reason": reason,
+            },
+        )
         FinancialCycleService.sync_monthly_record_from_contribution(contribution)
         return Response({"status": "Contribution rejected"})
 
@@ -248,22 +304,6 @@ class ContributionViewSet(viewsets.ModelViewSet):
         user = request.user
         contribution = self.get_object()
 
-        if user.role not in ("ADMIN", "TREASURER") and not user.is_superuser:
-            return Response(
-                {"detail": "Only admins and treasurers can delete contributions."},
-                status=status.HTTP_403_FORBIDDEN,
-            )
-
-        if (
-            user.role == "TREASURER"
-            and not user.is_superuser
-            and contribution.group.treasurer_id != user.id
-        ):
-            return Response(
-                {"detail": "You can only delete contributions in your own group."},
-                status=status.HTTP_403_FORBIDDEN,
-            )
-
         if contribution.is_locked:
             return Response(
                 {"detail": "Locked contributions cannot be deleted."},
@@ -289,21 +329,24 @@ class ContributionViewSet(viewsets.ModelViewSet):
                 
             # Notify Financial Secretary
             group = contribution.group
-            secretaries = User.objects.filter(
+            secretary_ids = User.objects.filter(
                 role="FINANCIAL_SECRETARY",
                 membership__group=group
-            ).distinct()
-            for sec in secretaries:
-                Notification.objects.create(
-                    recipient=sec,
+            ).distinct().values_list("id", flat=True)
+            message = (
+                f"Treasurer {user.get_full_name() or user.email} archived a contribution "
+                f"of {contribution.amount} for {contribution.user.get_full_name() or contribution.user.email}. "
+                f"Reason: {reason}"
+            )
+            Notification.objects.bulk_create(
+                Notification(
+                    recipient_id=secretary_id,
                     title="Financial Record Archived",
-                    message=(
-                        f"Treasurer {user.get_full_name() or user.email} archived a contribution "
-                        f"of {contribution.amount} for {contribution.user.get_full_name() or contribution.user.email}. "
-                        f"Reason: {reason}"
-                    ),
+                    message=message,
                     category="SYSTEM",
                 )
+                for secretary_id in secretary_ids
+            )
 
         return Response({"status": "Contribution archived"}, status=status.HTTP_200_OK)
 
@@ -311,32 +354,43 @@ class ContributionViewSet(viewsets.ModelViewSet):
 class PenaltyViewSet(viewsets.ModelViewSet):
     serializer_class = PenaltySerializer
     permission_classes = [IsAuthenticated, PenaltyPermission]
+    # Columns PenaltySerializer reads on a listing. applied_by is rendered as
+    # its id, so the list does not join the applying user at all.
+    list_only_fields = (
+        "id",
+        "user_id",
+        "contribution_id",
+        "amount",
+        "reason",
+        "applied_by_id",
+        "created_at",
+        "user__id",
+        "user__email",
+        "user__first_name",
+        "user__last_name",
+        "contribution__id",
+        "contribution__status",
+        "contribution__group_id",
+        "contribution__group__id",
+        "contribution__group__name",
+    )
 
     def get_queryset(self):
         user = self.request.user
-        base_queryset = Penalty.objects.select_related(
-            "user",
-            "applied_by",
-            "contribution__group",
-        ).prefetch_related(
-            "user__membership_set__group",
-        )
-
-        if user.is_superuser or user.role == "ADMIN":
-            return base_queryset
-
-        if user.role in ["TREASURER", "FINANCIAL_SECRETARY"]:
-            # Penalties in groups where the user is treasurer or secretary
-            user_groups = user.membership_set.values_list('group_id', flat=True)
-            return base_queryset.filter(
-                models.Q(contribution__group_id__in=user_groups) |
-                models.Q(user__membership_set__group_id__in=user_groups)
-            ).distinct()
-
-        if user.role == "MEMBER":
-            return base_queryset.filter(user=user, is_archived=False)
+        if self.action == "list":
+            base_queryset = Penalty.objects.select_related(
+                "user",
+                "contribution__group",
+            ).only(*self.list_only_fields)
+        else:
+            base_queryset = Penalty.objects.select_related(
+                "user",
+                "applied_by",
+                "contribution__group",
+            )
+        base_queryset = base_queryset.prefetch_related("user__membership_set__group")
 
-        return base_queryset.filter(is_archived=False)
+        return _scope_by_role(base_queryset, user, PENALTY_ROLE_FILTERS)
 
     def destroy(self, request, *args, **kwargs):
         user = request.user
@@ -356,10 +410,13 @@ class PenaltyViewSet(viewsets.ModelViewSet):
         # Let's be explicit.
         if is_treasurer and not is_admin:
             # Check if this penalty belongs to a group where the user is treasurer
+            treasurer_group_ids = get_request_treasurer_group_ids(request)
             has_permission = False
-            if penalty.contribution and penalty.contribution.group.treasurer_id == user.id:
+            if penalty.contribution_id and penalty.contribution.group_id in treasurer_group_ids:
                 has_permission = True
-            elif Membership.objects.filter(user=penalty.user, group__treasurer=user).exists():
+            elif Membership.objects.filter(
+                user_id=penalty.user_id, group_id__in=treasurer_group_ids
+            ).exists():
                 has_permission = True
                 
             if not has_permission:
@@ -398,26 +455,32 @@ class PenaltyViewSet(viewsets.ModelViewSet):
                     group = membership.group
             
             if group:
-                secretaries = User.objects.filter(
+                secretary_ids = User.objects.filter(
                     role="FINANCIAL_SECRETARY",
                     membership__group=group
-                ).distinct()
-                for sec in secretaries:
-                    Notification.objects.create(
-                        recipient=sec,
+                ).distinct().values_list("id", flat=True)
+                message = (
+                    f"Treasurer {user.get_full_name() or user.email} archived a penalty "
+                    f"of {penalty.amount} for {penalty.user.get_full_name() or penalty.user.email}. "
+                    f"Reason: {reason}"
+                )
+                Notification.objects.bulk_create(
+                    Notification(
+                        recipient_id=secretary_id,
                         title="Penalty Record Archived",
-                        message=(
-                            f"Treasurer {user.get_full_name() or user.email} archived a penalty "
-                            f"of {penalty.amount} for {penalty.user.get_full_name() or penalty.user.email}. "
-                            f"Reason: {reason}"
-                        ),
+                        message=message,
                         category="SYSTEM",
                     )
+                    for secretary_id in secretary_ids
+                )
 
         return Response({"status": "Penalty archived"}, status=status.HTTP_200_OK)
 
     def perform_create(self, serializer):
         actor = self.request.user
+        if actor.role not in ["ADMIN", "TREASURER"]:
+            raise PermissionDenied("Only Admins and Treasurers can create penalties.")
+
         contribution = serializer.validated_data.get("contribution")
         target_user = serializer.validated_data.get("user")
 
@@ -430,16 +493,15 @@ class PenaltyViewSet(viewsets.ModelViewSet):
 
         # Treasurer scope check
         if actor.role == "TREASURER":
-            if contribution and contribution.group.treasurer != actor:
+            treasurer_group_ids = get_request_treasurer_group_ids(self.request)
+            if contribution and contribution.group_id not in treasurer_group_ids:
                 raise PermissionDenied("Not your group's contribution.")
-            
-            # General role check for treasurer targeting users
-            from groups.models import Membership
-            if target_user and not Membership.objects.filter(user=target_user, group__treasurer=actor).exists():
-                raise PermissionDenied("You can only penalize users within your own group.")
 
-        if actor.role not in ["ADMIN", "TREASURER"]:
-            raise PermissionDenied("Only Admins and Treasurers can create penalties.")
+            # The member must belong to one of the treasurer's groups.
+            if not Membership.objects.filter(
+                user=target_user, group_id__in=treasurer_group_ids
+            ).exists():
+                raise PermissionDenied("You can only penalize users within your own group.")
 
         amount = serializer.validated_data.get("amount")
         if not amount and contribution:
@@ -448,16 +510,13 @@ class PenaltyViewSet(viewsets.ModelViewSet):
         if not amount:
             raise serializers.ValidationError("Amount is required if no contribution is linked or it has no suggested penalty.")
 
-        # Sync with contribution if linked
-        if contribution:
-            from decimal import Decimal
-            contribution.penalty = Decimal(str(amount))
-            contribution.save()
-
-        from django.db import transaction
-        from accounts.models import AuditLog
-
         with transaction.atomic():
+            # Sync with contribution if linked. Only the penalty column changes,
+            # so skip the full save() and its status re-evaluation.
+            if contribution:
+                contribution.penalty = amount
+                Contribution.objects.filter(pk=contribution.pk).update(penalty=amount)
+
             penalty = serializer.save(amount=amount, applied_by=actor, user=target_user)
             
             # Audit Logging
@@ -478,8 +537,15 @@ class FinancialInsightsView(APIView):
     def get(self, request):
         service = InsightService(request.user)
         data = service.get_insights()
+
+        # generated_at only moves when the cached insights are rebuilt, so it
+        # identifies the payload; unchanged insights answer 304 without a body.
+        etag = quote_etag(f"{request.user.id}-{data['generated_at'].timestamp()}")
+        if etag in parse_etags(request.headers.get("If-None-Match", "")):
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
         serializer = InsightSerializer(data)
-        return Response(serializer.data)
+        return Response(serializer.data, headers={"ETag": etag})
 
 
 # =========================
@@ -494,7 +560,10 @@ class AutoSavingConfigViewSet(viewsets.ModelViewSet):
     permission_classes = [IsAuthenticated, IsApprovedUser]
 
     def get_queryset(self):
-        return AutoSavingConfig.objects.filter(user=self.request.user, is_archived=False)
+        return AutoSavingConfig.objects.filter(
+            user=self.request.user,
+            is_archived=False,
+        ).select_related("group")
 
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
@@ -512,7 +581,32 @@ class SavingsTargetViewSet(viewsets.ModelViewSet):
     permission_classes = [IsAuthenticated, IsApprovedUser]
 
     def get_queryset(self):
-        return SavingsTarget.objects.filter(user=self.request.user)
+        queryset = SavingsTarget.objects.filter(user=self.request.user).select_related("group")
+        if self.action != "list":
+            # Writes change the inputs of the total, so single-object actions
+            # let total_saved query it fresh after the save.
+            return queryset
+
+        saved = (
+            Contribution.objects.filter(
+                **SavingsTarget.saved_contributions_filter(
+                    OuterRef("user"),
+                    OuterRef("group"),
+                    OuterRef("start_date"),
+                )
+            )
+            .order_by()
+            .values("user")
+            .annotate(total=Sum("amount"))
+            .values("total")
+        )
+        return queryset.annotate(
+            annotated_total_saved=Coalesce(
+                Subquery(saved),
+                Value(Decimal("0.00")),
+                output_field=DecimalField(max_digits=12, decimal_places=2),
+            )
+        )
 
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
@@ -547,19 +641,20 @@ class InvestmentViewSet(viewsets.ModelViewSet):
         user = self.request.user
         queryset = (
             Investment.objects.filter(is_archived=False)
-            .select_related("group", "created_by", "financial_cycle", "reviewed_by")
+            .select_related("created_by", "financial_cycle", "reviewed_by")
             .prefetch_related("status_logs")
         )
-
-        if user.is_superuser or user.role == "ADMIN":
-            scoped = queryset
-        elif user.role in ["TREASURER", "FINANCIAL_SECRETARY"]:
-            user_groups = user.membership_set.values_list('group_id', flat=True)
-            scoped = queryset.filter(group_id__in=user_groups)
-        elif user.role == "MEMBER":
-            scoped = queryset.filter(created_by=user)
+        if self.action in ("list", "inbox"):
+            # A handful of groups repeat across every row of a listing, so
+            # fetch their narrow columns once instead of joining the full
+            # Group row (description etc.) onto each investment.
+            queryset = queryset.prefetch_related(
+                Prefetch("group", queryset=Group.objects.only("id", "name", "treasurer_id"))
+            )
         else:
-            scoped = queryset.none()
+            queryset = queryset.select_related("group")
+
+        scoped = _scope_by_role(queryset, user, INVESTMENT_ROLE_FILTERS)
 
         params = self.request.query_params
 
@@ -716,10 +811,6 @@ class InvestmentViewSet(viewsets.ModelViewSet):
         notes = (request.data.get("notes") or "").strip()
         now = timezone.now()
 
-        from accounts.models import AuditLog
-        from notifications.models import Notification
-        from accounts.emails import send_investment_status_email
-
         with transaction.atomic():
             previous_status = investment.status
             investment.status = "APPROVED"
@@ -794,10 +885,6 @@ class InvestmentViewSet(viewsets.ModelViewSet):
 
         now = timezone.now()
 
-        from accounts.models import AuditLog
-        from notifications.models import Notification
-        from accounts.emails import send_investment_status_email
-
         with transaction.atomic():
             previous_status = investment.status
             investment.status = "REJECTED"
@@ -866,8 +953,6 @@ class InvestmentViewSet(viewsets.ModelViewSet):
         if not reason:
             return Response({"reason": "Override reason is required."}, status=status.HTTP_400_BAD_REQUEST)
 
-        from accounts.models import AuditLog
-
         previous_status = investment.status
         investment.status = "PENDING_APPROVAL"
         investment.decision_notes = reason
@@ -960,8 +1045,6 @@ class FinancialCycleViewSet(viewsets.ModelViewSet):
         new_cycle = result["new_cycle"]
         report = result["report"]
 
-        from accounts.models import AuditLog
-
         AuditLog.objects.create(
             actor=user,
             target_user=None,
@@ -1122,24 +1205,15 @@ class AdminAddContributionView(APIView):
     Allows admins/treasurers to manually add a contribution for a member.
     The contribution is created as PAID immediately.
     """
-    permission_classes = [IsAuthenticated]
+    permission_classes = [IsAuthenticated, IsAdminOrGroupTreasurer]
 
     def post(self, request):
         user = request.user
-        if user.role not in ("ADMIN", "TREASURER") and not user.is_superuser:
-            return Response(
-                {"detail": "Only admins and treasurers can add contributions."},
-                status=status.HTTP_403_FORBIDDEN,
-            )
-
         serializer = AdminAddContributionSerializer(
             data=request.data,
             context={"request": request},
         )
         if serializer.is_valid():
-            from django.db import transaction
-            from accounts.models import AuditLog
-
             with transaction.atomic():
                 contribution = serializer.save()
                 FinancialCycleService.sync_monthly_record_from_contribution(contribution)
@@ -1168,16 +1242,10 @@ class AdminResetMemberFinanceView(APIView):
     This supports lifecycle resets without deleting historical transactions.
     """
 
-    permission_classes = [IsAuthenticated]
+    permission_classes = [IsAuthenticated, IsFinanceAdmin]
 
     def post(self, request):
         actor = request.user
-        if actor.role != "ADMIN" and not actor.is_superuser:
-            return Response(
-                {"detail": "Only admins can reset member financial accounts."},
-                status=status.HTTP_403_FORBIDDEN,
-            )
-
         serializer = AdminResetMemberFinanceSerializer(
             data=request.data,
             context={"request": request},
@@ -1193,45 +1261,45 @@ class AdminResetMemberFinanceView(APIView):
 
         reset_report = ReportService.get_user_reset_report(target_user)
 
-        archived_contributions = Contribution.objects.filter(
-            user=target_user,
-            is_archived=False,
-        ).update(is_archived=True)
-        archived_penalties = Penalty.objects.filter(
-            user=target_user,
-            contribution__isnull=True,
-            is_archived=False,
-        ).update(is_archived=True)
-        MonthlyContributionRecord.objects.filter(
-            user=target_user,
-            is_archived=False,
-        ).update(is_archived=True)
+        # Nothing here needs a partial rollback; if an outer transaction is
+        # already open, join it instead of issuing a SAVEPOINT.
+        with transaction.atomic(savepoint=False):
+            archived_contributions = Contribution.objects.filter(
+                user=target_user,
+                is_archived=False,
+            ).update(is_archived=True)
+            archived_penalties = Penalty.objects.filter(
+                user=target_user,
+                contribution__isnull=True,
+                is_archived=False,
+            ).update(is_archived=True)
+            MonthlyContributionRecord.objects.filter(
+                user=target_user,
+                is_archived=False,
+            ).update(is_archived=True)
+
+            if reset_account_status:
+                User.objects.filter(pk=target_user.pk).update(
+                    is_approved=False,
+                    application_status="UNDER_REVIEW",
+                    membership_number=None,
+                )
 
-        if reset_account_status:
-            target_user.is_approved = False
-            target_user.application_status = "UNDER_REVIEW"
-            target_user.membership_number = None
-            target_user.save(
-                update_fields=[
-                    "is_approved",
-                    "application_status",
-                    "membership_number",
-                ]
+            AuditLog.objects.create(
+                actor=actor,
+                target_user=target_user,
+                action="DEACTIVATION",
+                notes=(
+                    "Financial account reset. "
+                    f"Archived contributions: {archived_contributions}, "
+                    f"archived standalone penalties: {archived_penalties}, "
+                    f"reset_account_status: {str(reset_account_status).lower()}."
+                ),
             )
 
-        from accounts.models import AuditLog
-
-        AuditLog.objects.create(
-            actor=actor,
-            target_user=target_user,
-            action="DEACTIVATION",
-            notes=(
-                "Financial account reset. "
-                f"Archived contributions: {archived_contributions}, "
-                f"archived standalone penalties: {archived_penalties}, "
-                f"reset_account_status: {str(reset_account_status).lower()}."
-            ),
-        )
+            # Bulk updates bypass model signals; evict once the reset is
+            # visible so a concurrent read cannot re-cache the old totals.
+            transaction.on_commit(lambda: InsightService.invalidate(target_user.id))
 
         return Response(
             {
@@ -1245,6 +1313,10 @@ class AdminResetMemberFinanceView(APIView):
         )
 
 
+class MemberCursorPagination(OptInCursorPagination):
+    ordering = "-id"
+
+
 class AdminMemberListView(ListAPIView):
     """
     Lists all memberships with their financial summary (e.g. total savings/penalties).
@@ -1253,6 +1325,7 @@ class AdminMemberListView(ListAPIView):
 
     permission_classes = [IsAuthenticated, IsTreasurerOrAdminOrFinancialSecretaryReadOnly]
     serializer_class = AdminMembershipSerializer
+    pagination_class = MemberCursorPagination
     filter_backends = [filters.SearchFilter]
     search_fields = [
         "user__email", 
@@ -1264,10 +1337,22 @@ class AdminMemberListView(ListAPIView):
 
     def get_queryset(self):
         user = self.request.user
-        if user.role not in ("ADMIN", "TREASURER", "FINANCIAL_SECRETARY") and not user.is_superuser:
-            raise PermissionDenied("Only admins, treasurers, and financial secretaries can view this list.")
-
-        queryset = Membership.objects.select_related("user", "group")
+        # AdminMembershipSerializer only reads these columns of the joined
+        # user and group; skip the rest (password hash, profile fields, ...).
+        queryset = Membership.objects.select_related("user", "group").only(
+            "id",
+            "role",
+            "joined_at",
+            "user_id",
+            "group_id",
+            "user__id",
+            "user__email",
+            "user__first_name",
+            "user__last_name",
+            "user__membership_number",
+            "group__id",
+            "group__name",
+        )
 
         # Role-based filtering
         if not user.is_superuser and user.role != "ADMIN":
@@ -1507,16 +1592,11 @@ class FinancialReportView(APIView):
 
     def get(self, request):
         user = request.user
-        if user.role not in ("ADMIN", "TREASURER", "FINANCIAL_SECRETARY") and not user.is_superuser:
-            return Response(
-                {"detail": "Only admins, treasurers, and financial secretaries can access reports."},
-                status=status.HTTP_403_FORBIDDEN,
-            )
-
         group_id = request.query_params.get("group_id")
         cycle_id = request.query_params.get("cycle_id")
-        month_str = request.query_params.get("month", str(timezone.now().month))
-        year_str = request.query_params.get("year", str(timezone.now().year))
+        now = timezone.now()
+        month_str = request.query_params.get("month", str(now.month))
+        year_str = request.query_params.get("year", str(now.year))
         
         try:
             month = int(month_str)
@@ -1529,14 +1609,17 @@ class FinancialReportView(APIView):
 
         # Treasurer check
         if user.role in ["TREASURER", "FINANCIAL_SECRETARY"] and not user.is_superuser:
-            try:
-                group = Group.objects.get(pk=group_id)
-                if user.role == "TREASURER" and group.treasurer_id != user.id:
-                    return Response({"detail": "You can only view reports for your own group."}, status=status.HTTP_403_FORBIDDEN)
-                if user.role == "FINANCIAL_SECRETARY" and not group.memberships.filter(user=user).exists():
-                    return Response({"detail": "You can only view reports for groups you are a member of."}, status=status.HTTP_403_FORBIDDEN)
-            except Group.DoesNotExist:
+            # Only the treasurer id is needed, not a hydrated Group.
+            group_row = Group.objects.filter(pk=group_id).values("treasurer_id").first()
+            if group_row is None:
                 return Response({"detail": "Group not found."}, status=status.HTTP_404_NOT_FOUND)
+            if user.role == "TREASURER" and group_row["treasurer_id"] != user.id:
+                return Response({"detail": "You can only view reports for your own group."}, status=status.HTTP_403_FORBIDDEN)
+            if (
+                user.role == "FINANCIAL_SECRETARY"
+                and not Membership.objects.filter(user=user, group_id=group_id).exists()
+            ):
+                return Response({"detail": "You can only view reports for groups you are a member of."}, status=status.HTTP_403_FORBIDDEN)
 
         summary = ReportService.get_monthly_summary(
             group_id=group_id,
@@ -1647,9 +1730,6 @@ class FinancialSecretaryReportView(APIView):
         group_stats = service.get_group_analytics(group_id=group_id, cycle_id=cycle_id)
         
         # We also want member-level summaries for the secretary
-        from .models import Contribution, Penalty, Investment
-        from django.db.models import Sum, Count
-        
         members = group.memberships.select_related("user").all()
         member_summaries = []
         for membership in members:
@@ -22,6 +22,10 @@ class GroupSerializer(serializers.ModelSerializer):
         )
 
     def get_total_contributions(self, obj):
+        # GroupViewSet annotates the total; fall back to a query for
+        # instances that did not come through its queryset.
+        if hasattr(obj, "total_contributions"):
+            return obj.total_contributions or 0.0
         return (
             obj.finance_contributions.filter(
                 status__in=["PAID", "LATE"],
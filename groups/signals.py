@@ -0,0 +1,11 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Membership
+from .utils import invalidate_membership_role
+
+
+@receiver(post_save, sender=Membership)
+@receiver(post_delete, sender=Membership)
+def clear_cached_membership_role(sender, instance, **kwargs):
+    invalidate_membership_role(instance.user_id, instance.group_id)
@@ -1,10 +1,21 @@
+from datetime import date
+from types import SimpleNamespace
+
+from django.core.cache import cache
+from django.test import TestCase
 from django.urls import reverse
 from django.contrib.auth import get_user_model
 from rest_framework import status
 from rest_framework.test import APITestCase
 from rest_framework_simplejwt.tokens import RefreshToken
 
+from finance.models import Contribution
 from .models import Group, Membership
+from .utils import (
+    get_membership_role,
+    is_request_group_member,
+    prime_request_membership_cache,
+)
 
 User = get_user_model()
 
@@ -29,6 +40,63 @@ class GroupAccessTests(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertTrue(any(item["id"] == self.group.id for item in response.data))
 
+    def test_group_list_totals_are_annotated(self):
+        other = Group.objects.create(name="Second Group", treasurer=self.treasurer)
+        for group, amount in ((self.group, "300.00"), (self.group, "200.00"), (other, "50.00")):
+            Contribution.objects.create(
+                user=self.treasurer,
+                group=group,
+                amount=amount,
+                due_date=date.today(),
+                paid_date=date.today(),
+                status="PAID",
+            )
+
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse("group-list"))
+
+        totals = {item["id"]: item["total_contributions"] for item in response.data}
+        self.assertEqual(float(totals[self.group.id]), 500.0)
+        self.assertEqual(float(totals[other.id]), 50.0)
+
+
+class GroupScopeTests(APITestCase):
+    def setUp(self):
+        self.treasurer = User.objects.create_user(
+            email="scope-treasurer@test.com",
+            password="Treasurer123!",
+            role="TREASURER",
+            is_active=True,
+            is_approved=True,
+        )
+        self.member = User.objects.create_user(
+            email="scope-member@test.com",
+            password="Member123!",
+            role="MEMBER",
+            is_active=True,
+            is_approved=True,
+        )
+        self.managed = Group.objects.create(name="Managed Group", treasurer=self.treasurer)
+        self.joined = Group.objects.create(name="Joined Group", treasurer=self.member)
+        self.unrelated = Group.objects.create(name="Unrelated Group", treasurer=self.member)
+        # Several memberships in the managed group must not duplicate it.
+        Membership.objects.create(user=self.treasurer, group=self.managed, role="TREASURER")
+        Membership.objects.create(user=self.member, group=self.managed, role="MEMBER")
+        Membership.objects.create(user=self.treasurer, group=self.joined, role="MEMBER")
+
+    def test_treasurer_sees_managed_and_joined_groups_once(self):
+        self.client.force_authenticate(user=self.treasurer)
+        response = self.client.get(reverse("group-list"))
+
+        ids = [item["id"] for item in response.data]
+        self.assertCountEqual(ids, [self.managed.id, self.joined.id])
+
+    def test_member_sees_only_joined_groups(self):
+        self.client.force_authenticate(user=self.member)
+        response = self.client.get(reverse("group-list"))
+
+        self.assertEqual([item["id"] for item in response.data], [self.managed.id])
+
 
 class MembershipAssignmentTests(APITestCase):
     def setUp(self):
@@ -117,3 +185,51 @@ class MembershipAssignmentTests(APITestCase):
             format="json",
         )
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
+class MembershipRoleCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.treasurer = User.objects.create_user(
+            email="cache-treasurer@test.com",
+            password="Treasurer123!",
+            role="TREASURER",
+            is_active=True,
+            is_approved=True,
+        )
+        self.member = User.objects.create_user(
+            email="cache-member@test.com",
+            password="Member123!",
+            role="MEMBER",
+            is_active=True,
+            is_approved=True,
+        )
+        self.group = Group.objects.create(name="Cache Group", treasurer=self.treasurer)
+
+    def test_role_lookup_is_served_from_cache(self):
+        Membership.objects.create(user=self.member, group=self.group, role="MEMBER")
+
+        self.assertEqual(get_membership_role(self.member.id, self.group.id), "MEMBER")
+        with self.assertNumQueries(0):
+            self.assertEqual(get_membership_role(self.member.id, self.group.id), "MEMBER")
+
+    def test_membership_changes_invalidate_cached_role(self):
+        self.assertIsNone(get_membership_role(self.member.id, self.group.id))
+
+        membership = Membership.objects.create(user=self.member, group=self.group, role="MEMBER")
+        self.assertEqual(get_membership_role(self.member.id, self.group.id), "MEMBER")
+
+        membership.delete()
+        self.assertIsNone(get_membership_role(self.member.id, self.group.id))
+
+    def test_primed_request_cache_answers_without_queries(self):
+        Membership.objects.create(user=self.member, group=self.group, role="MEMBER")
+        other_group = Group.objects.create(name="Other Cache Group", treasurer=self.treasurer)
+        request = SimpleNamespace(user=self.member)
+
+        with self.assertNumQueries(1):
+            prime_request_membership_cache(request, [self.group.id, other_group.id])
+
+        with self.assertNumQueries(0):
+            self.assertTrue(is_request_group_member(request, self.group.id))
+            self.assertFalse(is_request_group_member(request, other_group.id))
@@ -0,0 +1,92 @@
+from django.core.cache import cache
+
+from .models import Group, Membership
+
+# Short TTL bounds staleness for writes that bypass model signals
+# (queryset.update(), bulk_create, raw SQL).
+MEMBERSHIP_ROLE_TTL = 30
+
+# Cached in place of a role when the user has no membership in the group,
+# so negative lookups are served from cache too.
+NO_MEMBERSHIP = ""
+
+
+def membership_role_cache_key(user_id, group_id):
+    return f"membership-role:{user_id}:{group_id}"
+
+
+def get_membership_role(user_id, group_id):
+    """
+    Returns the user's Membership.role in the group, or None if they are not
+    a member. Backed by Django's cache so repeated permission/serializer
+    checks across requests skip the SELECT.
+    """
+    key = membership_role_cache_key(user_id, group_id)
+    role = cache.get(key)
+    if role is None:
+        role = (
+            Membership.objects.filter(user_id=user_id, group_id=group_id)
+            .values_list("role", flat=True)
+            .first()
+        ) or NO_MEMBERSHIP
+        cache.set(key, role, MEMBERSHIP_ROLE_TTL)
+    return role or None
+
+
+def is_group_member(user_id, group_id):
+    return get_membership_role(user_id, group_id) is not None
+
+
+def invalidate_membership_role(user_id, group_id):
+    cache.delete(membership_role_cache_key(user_id, group_id))
+
+
+def get_request_membership_role(request, group_id):
+    """
+    Request-scoped front for get_membership_role: repeated checks for the
+    same group while serving one request (e.g. several serializers or a
+    many=True payload) are answered from a dict on the request.
+    """
+    roles = getattr(request, "_membership_cache", None)
+    if roles is None:
+        roles = request._membership_cache = {}
+    if group_id not in roles:
+        roles[group_id] = get_membership_role(request.user.id, group_id)
+    return roles[group_id]
+
+
+def prime_request_membership_cache(request, group_ids):
+    """
+    Resolve the requesting user's roles for many groups with one query,
+    e.g. before validating a bulk payload.
+    """
+    roles = getattr(request, "_membership_cache", None)
+    if roles is None:
+        roles = request._membership_cache = {}
+    missing = {group_id for group_id in group_ids if group_id not in roles}
+    if not missing:
+        return roles
+    found = dict(
+        Membership.objects.filter(user_id=request.user.id, group_id__in=missing)
+        .values_list("group_id", "role")
+    )
+    for group_id in missing:
+        roles[group_id] = found.get(group_id)
+    return roles
+
+
+def is_request_group_member(request, group_id):
+    return get_request_membership_role(request, group_id) is not None
+
+
+def get_request_treasurer_group_ids(request):
+    """
+    Ids of the groups the requesting user is treasurer of, resolved once per
+    request so scope checks compare ids instead of loading each group.
+    """
+    group_ids = getattr(request, "_treasurer_group_ids", None)
+    if group_ids is None:
+        group_ids = request._treasurer_group_ids = frozenset(
+            Group.objects.filter(treasurer_id=request.user.id).values_list("id", flat=True)
+        )
+    return group_ids
@@ -1,9 +1,31 @@
 from rest_framework import viewsets, permissions
 from rest_framework.exceptions import PermissionDenied
-from django.db.models import Q
+from django.db.models import DecimalField, Exists, OuterRef, Q, Subquery, Sum
 from .models import Group, Membership
 from .serializers import GroupSerializer, MembershipSerializer
 from accounts.models import AuditLog
+from finance.models import Contribution
+
+
+def _with_total_contributions(queryset):
+    # Correlated subquery rather than Sum() over the reverse join, so the
+    # total cannot be multiplied by joins in the scoped queryset.
+    totals = (
+        Contribution.objects.filter(
+            group=OuterRef("pk"),
+            status__in=["PAID", "LATE"],
+            is_archived=False,
+        )
+        .values("group")
+        .annotate(total=Sum("amount"))
+        .values("total")
+    )
+    return queryset.annotate(
+        total_contributions=Subquery(
+            totals,
+            output_field=DecimalField(max_digits=12, decimal_places=2),
+        )
+    )
 
 
 class GroupViewSet(viewsets.ModelViewSet):
@@ -16,6 +38,9 @@ class GroupViewSet(viewsets.ModelViewSet):
         return [permissions.IsAuthenticated()]
 
     def get_queryset(self):
+        return _with_total_contributions(self._get_scoped_queryset())
+
+    def _get_scoped_queryset(self):
         user = self.request.user
         if not user.is_authenticated:
             return Group.objects.all()
@@ -23,13 +48,13 @@ class GroupViewSet(viewsets.ModelViewSet):
         if user.is_superuser or user.role == "ADMIN":
             return Group.objects.all()
 
+        # EXISTS instead of joining memberships, so no DISTINCT is needed.
+        is_member = Exists(Membership.objects.filter(group=OuterRef("pk"), user=user))
         if user.role == "TREASURER":
             # Treasurers manage their own groups and see groups they are members of
-            return Group.objects.filter(
-                Q(treasurer=user) | Q(memberships__user=user)
-            ).distinct()
+            return Group.objects.filter(Q(treasurer=user) | Q(is_member))
 
-        return Group.objects.filter(memberships__user=user).distinct()
+        return Group.objects.filter(is_member)
 
     def perform_create(self, serializer):
         user = self.request.user
@@ -39,7 +64,8 @@ class GroupViewSet(viewsets.ModelViewSet):
 
     def perform_update(self, serializer):
         user = self.request.user
-        group = self.get_object()
+        # update() already fetched and permission-checked the instance.
+        group = serializer.instance
         if not user.is_superuser and user.role != "ADMIN" and group.treasurer_id != user.id:
             raise PermissionDenied("You can only update groups you manage.")
         serializer.save()
@@ -86,7 +112,7 @@ class MembershipViewSet(viewsets.ModelViewSet):
 
     def perform_update(self, serializer):
         actor = self.request.user
-        membership = self.get_object()
+        membership = serializer.instance
         if not (actor.is_superuser or actor.role == "ADMIN"):
             if actor.role != "TREASURER" or membership.group.treasurer_id != actor.id:
                 raise PermissionDenied("You can only update memberships in your own group.")
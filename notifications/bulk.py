@@ -0,0 +1,82 @@
+import threading
+from contextlib import contextmanager
+
+from django.db import connection
+from django.db.models import Value
+from django.utils import timezone
+
+from .models import Notification
+
+BULK_BATCH_SIZE = 1000
+
+_state = threading.local()
+
+
+def queue_notifications(notifications):
+    """
+    Insert notifications now, or hold them for the enclosing
+    batched_notifications() block. Callers must only pass notifications
+    for committed rows: signal handlers call this from
+    transaction.on_commit, never directly from the signal.
+
+    Always goes through bulk_create, even for one row, so Notification
+    post_save receivers never run per row on these paths.
+    """
+    pending = getattr(_state, "pending", None)
+    if pending is None:
+        Notification.objects.bulk_create(notifications)
+    else:
+        pending.extend(notifications)
+
+
+@contextmanager
+def batched_notifications():
+    """
+    Collect the notifications signal handlers produce while the block runs
+    (e.g. a loop issuing many penalties) and insert them with one
+    bulk_create on exit instead of one INSERT per saved row.
+    """
+    if getattr(_state, "pending", None) is not None:
+        # Nested: the outer block flushes.
+        yield
+        return
+
+    _state.pending = pending = []
+    try:
+        yield
+    finally:
+        _state.pending = None
+        # Everything queued belongs to committed rows, so flush even if the
+        # block raised part-way through.
+        Notification.objects.bulk_create(pending, batch_size=BULK_BATCH_SIZE)
+
+
+def insert_notifications_for(recipients, **values):
+    """
+    Create one notification per user in ``recipients`` (a User queryset)
+    with a single INSERT ... SELECT, so the rows are built by the database
+    rather than as model instances. ``values`` gives the notification fields;
+    returns the number of rows inserted.
+    """
+    values = {"link": None, "is_read": False, "created_at": timezone.now(), **values}
+    fields = [Notification._meta.get_field(name) for name in values]
+    selected = recipients.order_by().annotate(
+        **{
+            f"notification_{field.name}": Value(values[field.name], output_field=field)
+            for field in fields
+        }
+    ).values_list("pk", *(f"notification_{field.name}" for field in fields))
+    select_sql, params = selected.query.sql_with_params()
+
+    quote = connection.ops.quote_name
+    columns = ", ".join(
+        quote(column)
+        for column in [Notification._meta.get_field("recipient").column]
+        + [field.column for field in fields]
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"INSERT INTO {quote(Notification._meta.db_table)} ({columns}) {select_sql}",
+            params,
+        )
+        return cursor.rowcount
@@ -41,6 +41,17 @@ class Notification(models.Model):
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            # Backs the inbox list (recipient_id = ? ORDER BY created_at DESC).
+            models.Index(fields=["recipient", "-created_at"], name="notif_recip_created_idx"),
+            # Most notifications end up read; only index the unread ones
+            # that mark_all_read and unread counts look for.
+            models.Index(
+                fields=["recipient"],
+                condition=models.Q(is_read=False),
+                name="notif_recip_unread_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.title} - {self.recipient}"
@@ -1,49 +1,109 @@
-from django.db.models.signals import post_save
+from django.db import transaction
+from django.db.models.signals import post_delete, post_init, post_save
 from django.dispatch import receiver
 from django.contrib.auth import get_user_model
 from finance.models import Contribution, Penalty
+from groups.models import Membership
+from .bulk import queue_notifications
 from .models import Notification
+from .utils import get_active_admin_ids, invalidate_active_admin_ids
 
 User = get_user_model()
 
 
+# The User fields that decide who is in the cached admin id list.
+ADMIN_ID_FIELDS = ("role", "is_active", "is_approved")
+
+
+def _admin_id_state(instance):
+    # Read from __dict__ so deferred fields are never loaded here.
+    return tuple(instance.__dict__.get(field) for field in ADMIN_ID_FIELDS)
+
 
+@receiver(post_init, sender=User)
+def remember_admin_id_state(sender, instance, **kwargs):
+    instance._loaded_admin_id_state = _admin_id_state(instance)
+
+
+@receiver(post_save, sender=User)
+def clear_cached_admin_ids_on_save(sender, instance, created, update_fields=None, **kwargs):
+    # Routine writes such as the last_login update on each login must not
+    # evict the cache; only creation or a change to an admin-list field does.
+    state = _admin_id_state(instance)
+    loaded_state = getattr(instance, "_loaded_admin_id_state", None)
+    instance._loaded_admin_id_state = state
+    if not created:
+        if update_fields is not None and not set(update_fields) & set(ADMIN_ID_FIELDS):
+            return
+        if state == loaded_state:
+            return
+    invalidate_active_admin_ids()
+
+
+@receiver(post_delete, sender=User)
+def clear_cached_admin_ids_on_delete(sender, instance, **kwargs):
+    invalidate_active_admin_ids()
 
 
 @receiver(post_save, sender=Penalty)
 def notify_penalty_assigned(sender, instance, created, **kwargs):
     if created:
-        recipient = instance.user
-        if not recipient and instance.contribution:
-            recipient = instance.contribution.user
-            
-        if not recipient:
-            return
+        # Notifications are written after the originating transaction
+        # commits, so they stay off its critical path and a rolled-back
+        # save notifies nobody.
+        transaction.on_commit(lambda: _create_penalty_notification(instance))
+
+
+def _create_penalty_notification(instance):
+    # Work from ids so the contribution and users are not loaded just to be
+    # referenced.
+    recipient_id = instance.user_id
+    if not recipient_id and instance.contribution_id:
+        if Penalty.contribution.is_cached(instance):
+            recipient_id = instance.contribution.user_id
+        else:
+            recipient_id = (
+                Contribution.objects.filter(pk=instance.contribution_id)
+                .values_list("user_id", flat=True)
+                .first()
+            )
+
+    if not recipient_id:
+        return
 
-        link = "/finance/penalties/"
-        if instance.contribution:
-            link = f"/finance/contributions/{instance.contribution.id}"
+    link = "/finance/penalties/"
+    if instance.contribution_id:
+        link = f"/finance/contributions/{instance.contribution_id}"
 
-        Notification.objects.create(
-            recipient=recipient,
+    queue_notifications([
+        Notification(
+            recipient_id=recipient_id,
             title="Penalty Applied",
             message=f"A penalty of {instance.amount} has been applied to your account.",
             category="SYSTEM",
             link=link,
         )
+    ])
 
 
-from groups.models import Membership
+@receiver(post_save, sender=Membership)
 def notify_membership_added(sender, instance, created, **kwargs):
     if created:
-        Notification.objects.create(
-            recipient=instance.user,
+        # queue_notifications() expects committed rows; see its docstring.
+        transaction.on_commit(lambda: _create_membership_notification(instance))
+
+
+def _create_membership_notification(instance):
+    queue_notifications([
+        Notification(
+            recipient_id=instance.user_id,
             title="Group Membership",
             message=f"You have been added to the group '{instance.group.name}' as {instance.get_role_display()}.",
             category="SYSTEM",
             type="INFO",
-            link=f"/groups/{instance.group.id}",
+            link=f"/groups/{instance.group_id}",
         )
+    ])
 
 
 @receiver(post_save, sender=Contribution)
@@ -57,43 +117,38 @@ def notify_manual_contribution_proposed(sender, instance, created, **kwargs):
     if not instance.is_manual_entry or instance.status != "PENDING":
         return
 
-    recipients = list(
-        User.objects.filter(
-            is_active=True,
-            is_approved=True,
-            role="ADMIN",
-        )
-    )
+    transaction.on_commit(lambda: _create_proposal_notifications(instance))
+
 
-    treasurer = instance.group.treasurer
+def _create_proposal_notifications(instance):
+    recipient_ids = list(get_active_admin_ids())
+    treasurer_id = instance.group.treasurer_id
     if (
-        treasurer
-        and treasurer.is_active
-        and treasurer.is_approved
-        and all(r.id != treasurer.id for r in recipients)
+        treasurer_id not in recipient_ids
+        and User.objects.filter(pk=treasurer_id, is_active=True, is_approved=True).exists()
     ):
-        recipients.append(treasurer)
-
-    if not recipients:
+        recipient_ids.append(treasurer_id)
+    if not recipient_ids:
         return
 
     title = "Contribution Proposal Submitted"
-    message = (
+    proposer = (
         f"{instance.user.first_name} {instance.user.last_name}".strip()
         or instance.user.email
     )
+    message = (
+        f"{proposer} proposed KES {instance.amount} for "
+        f"{instance.group.name}. Verify in contribution management."
+    )
     notifications = [
         Notification(
-            recipient=recipient,
+            recipient_id=recipient_id,
             title=title,
-            message=(
-                f"{message} proposed KES {instance.amount} for "
-                f"{instance.group.name}. Verify in contribution management."
-            ),
+            message=message,
             category="PROPOSAL",
             type="INFO",
             link="/governance/contributions",
         )
-        for recipient in recipients
+        for recipient_id in recipient_ids
     ]
-    Notification.objects.bulk_create(notifications)
+    queue_notifications(notifications)
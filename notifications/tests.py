@@ -1,10 +1,17 @@
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
+from django.utils import timezone
 from rest_framework.test import APITestCase
 from rest_framework import status
 from django.contrib.auth import get_user_model
 from finance.models import Contribution, Penalty
 from groups.models import Group, Membership
-from .models import Notification
+from .bulk import batched_notifications
+from .signals import _create_penalty_notification
+from .models import Notification, NotificationPreference
+from .utils import get_active_admin_ids
 from decimal import Decimal
 from datetime import date
 
@@ -62,6 +69,29 @@ class NotificationTests(APITestCase):
         self.assertIn("Notification 1", titles)
         self.assertIn("Notification 2", titles)
 
+    def test_list_notifications_pages_with_cursor_when_requested(self):
+        for index in range(3):
+            Notification.objects.create(
+                recipient=self.user,
+                title=f"Paged {index}",
+                message="Paged",
+            )
+        total = Notification.objects.filter(recipient=self.user).count()
+
+        url = reverse("notification-list")
+        seen = []
+        response = self.client.get(url, {"page_size": 2})
+        while True:
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertLessEqual(len(response.data["results"]), 2)
+            seen.extend(item["id"] for item in response.data["results"])
+            if not response.data["next"]:
+                break
+            response = self.client.get(response.data["next"])
+
+        self.assertEqual(len(seen), total)
+        self.assertEqual(len(set(seen)), total)
+
     def test_mark_as_read(self):
         notification = Notification.objects.create(
             recipient=self.user,
@@ -80,11 +110,14 @@ class NotificationTests(APITestCase):
     def test_mark_all_as_read(self):
         Notification.objects.create(recipient=self.user, title="1", message="1")
         Notification.objects.create(recipient=self.user, title="2", message="2")
+        Notification.objects.create(recipient=self.user, title="3", message="3", is_read=True)
+        unread = Notification.objects.filter(recipient=self.user, is_read=False).count()
 
         url = reverse("notification-mark-all-read")
         response = self.client.post(url)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["updated"], unread)
         self.assertFalse(Notification.objects.filter(is_read=False).exists())
 
 
@@ -129,27 +162,98 @@ class NotificationTriggerTests(APITestCase):
         )
 
         # Create penalty
-        Penalty.objects.create(
+        with self.captureOnCommitCallbacks(execute=True):
+            Penalty.objects.create(
+                contribution=contribution,
+                amount=Decimal("10.00"),
+                reason="Late payment",
+                applied_by=self.user,
+            )
+
+        # Check notification
+        self.assertTrue(Notification.objects.filter(recipient=self.user, title="Penalty Applied").exists())
+
+    def test_penalty_notification_uses_linked_ids(self):
+        group = Group.objects.create(name="Ids Group", treasurer=self.user)
+        contribution = Contribution.objects.create(
+            user=self.user,
+            group=group,
+            amount=Decimal("100.00"),
+            due_date=date.today(),
+        )
+        penalty = Penalty.objects.create(
+            user=self.user,
             contribution=contribution,
             amount=Decimal("10.00"),
             reason="Late payment",
-            applied_by=self.user,
         )
+        penalty = Penalty.objects.get(pk=penalty.pk)
 
-        # Check notification
-        self.assertTrue(Notification.objects.filter(recipient=self.user, title="Penalty Applied").exists())
+        # Only the notification INSERT; no user or contribution loads.
+        with self.assertNumQueries(1):
+            _create_penalty_notification(penalty)
+
+        notification = Notification.objects.get(recipient=self.user, title="Penalty Applied")
+        self.assertEqual(notification.link, f"/finance/contributions/{contribution.id}")
+
+    def test_batched_penalty_notifications_insert_once(self):
+        group = Group.objects.create(name="Batch Group", treasurer=self.user)
+        contribution = Contribution.objects.create(
+            user=self.user,
+            group=group,
+            amount=Decimal("100.00"),
+            due_date=date.today(),
+        )
+
+        with CaptureQueriesContext(connection) as captured:
+            with batched_notifications():
+                with self.captureOnCommitCallbacks(execute=True):
+                    for amount in ("10.00", "20.00"):
+                        Penalty.objects.create(
+                            contribution=contribution,
+                            amount=Decimal(amount),
+                            reason="Late payment",
+                            applied_by=self.user,
+                        )
+                self.assertFalse(
+                    Notification.objects.filter(title="Penalty Applied").exists()
+                )
+
+        inserts = [
+            query["sql"]
+            for query in captured.captured_queries
+            if query["sql"].startswith('INSERT INTO "notifications_notification"')
+        ]
+        self.assertEqual(len(inserts), 1)
+        self.assertEqual(Notification.objects.filter(title="Penalty Applied").count(), 2)
+
+    def test_rolled_back_membership_is_not_notified_inside_batch(self):
+        group = Group.objects.create(name="Rollback Group", treasurer=self.user)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            with batched_notifications():
+                with self.assertRaises(RuntimeError):
+                    with transaction.atomic():
+                        Membership.objects.create(user=self.user, group=group, role="MEMBER")
+                        raise RuntimeError("roll back")
+
+        self.assertFalse(
+            Notification.objects.filter(recipient=self.user, title="Group Membership").exists()
+        )
 
     def test_membership_notification_trigger(self):
         from groups.models import Membership, Group
         group = Group.objects.create(name="Signal Group", treasurer=self.user)
         
-        Membership.objects.create(user=self.user, group=group, role="MEMBER")
+        with self.captureOnCommitCallbacks(execute=True):
+            Membership.objects.create(user=self.user, group=group, role="MEMBER")
         
         self.assertTrue(Notification.objects.filter(recipient=self.user, title="Group Membership").exists())
 
 
 class NotificationPreferencesAndProposalTests(APITestCase):
     def setUp(self):
+        cache.clear()
         self.admin = User.objects.create_user(
             email="notify-admin@seedvest.com",
             password="pass123",
@@ -196,6 +300,41 @@ class NotificationPreferencesAndProposalTests(APITestCase):
             ).exists()
         )
 
+    def test_broadcast_inserts_with_one_statement(self):
+        for index in range(3):
+            User.objects.create_user(
+                email=f"notify-batch-{index}@seedvest.com",
+                password="pass123",
+                role="MEMBER",
+                is_active=True,
+                is_approved=True,
+            )
+        self.client.force_authenticate(user=self.admin)
+
+        with CaptureQueriesContext(connection) as captured:
+            response = self.client.post(
+                reverse("notification-broadcast"),
+                {"title": "Batched", "message": "Sent in one statement."},
+                format="json",
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["status"], "Broadcast sent to 4 users")
+        inserts = [
+            query["sql"]
+            for query in captured.captured_queries
+            if query["sql"].startswith('INSERT INTO "notifications_notification"')
+        ]
+        self.assertEqual(len(inserts), 1)
+
+        notification = Notification.objects.filter(title="Batched").first()
+        self.assertEqual(Notification.objects.filter(title="Batched").count(), 4)
+        self.assertEqual(notification.category, "INTERNAL")
+        self.assertEqual(notification.type, "INFO")
+        self.assertFalse(notification.is_read)
+        self.assertIsNone(notification.link)
+        self.assertIsNotNone(notification.created_at)
+
     def test_member_can_mute_internal_messages(self):
         Notification.objects.create(
             recipient=self.member,
@@ -222,7 +361,8 @@ class NotificationPreferencesAndProposalTests(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertTrue(response.data["mute_internal_messages"])
 
-        list_response = self.client.get(reverse("notification-list"))
+        with self.assertNumQueries(1):
+            list_response = self.client.get(reverse("notification-list"))
         self.assertEqual(list_response.status_code, status.HTTP_200_OK)
         self.assertTrue(
             all(item["category"] != "INTERNAL" for item in list_response.data)
@@ -231,15 +371,38 @@ class NotificationPreferencesAndProposalTests(APITestCase):
             any(item["category"] == "SYSTEM" for item in list_response.data)
         )
 
-    def test_manual_contribution_proposal_creates_admin_notification(self):
-        Contribution.objects.create(
+    def test_mark_all_read_includes_muted_internal_messages(self):
+        Notification.objects.create(
+            recipient=self.member,
+            title="Internal Notice",
+            message="Members only",
+            category="INTERNAL",
+        )
+        NotificationPreference.objects.create(
             user=self.member,
-            group=self.group,
-            amount=Decimal("1500.00"),
-            due_date=date.today(),
-            is_manual_entry=True,
-            status="PENDING",
+            mute_internal_messages=True,
         )
+        unread = Notification.objects.filter(recipient=self.member, is_read=False).count()
+
+        self.client.force_authenticate(user=self.member)
+        with self.assertNumQueries(1):
+            response = self.client.post(reverse("notification-mark-all-read"))
+
+        self.assertEqual(response.data["updated"], unread)
+        self.assertFalse(
+            Notification.objects.filter(recipient=self.member, is_read=False).exists()
+        )
+
+    def test_manual_contribution_proposal_creates_admin_notification(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            Contribution.objects.create(
+                user=self.member,
+                group=self.group,
+                amount=Decimal("1500.00"),
+                due_date=date.today(),
+                is_manual_entry=True,
+                status="PENDING",
+            )
 
         self.assertTrue(
             Notification.objects.filter(
@@ -248,3 +411,68 @@ class NotificationPreferencesAndProposalTests(APITestCase):
                 title="Contribution Proposal Submitted",
             ).exists()
         )
+
+    def test_manual_contribution_proposal_notifies_each_reviewer_once(self):
+        treasurer = User.objects.create_user(
+            email="notify-treasurer@seedvest.com",
+            password="pass123",
+            role="TREASURER",
+            is_active=True,
+            is_approved=True,
+        )
+        self.group.treasurer = treasurer
+        self.group.save(update_fields=["treasurer"])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Contribution.objects.create(
+                user=self.member,
+                group=self.group,
+                amount=Decimal("900.00"),
+                due_date=date.today(),
+                is_manual_entry=True,
+                status="PENDING",
+            )
+
+        recipients = Notification.objects.filter(category="PROPOSAL").values_list(
+            "recipient_id", flat=True
+        )
+        self.assertCountEqual(recipients, [self.admin.id, treasurer.id])
+
+    def test_proposal_notifications_wait_for_commit(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            Contribution.objects.create(
+                user=self.member,
+                group=self.group,
+                amount=Decimal("400.00"),
+                due_date=date.today(),
+                is_manual_entry=True,
+                status="PENDING",
+            )
+            self.assertFalse(Notification.objects.filter(category="PROPOSAL").exists())
+
+        self.assertEqual(len(callbacks), 1)
+
+    def test_admin_ids_are_cached_until_a_user_changes(self):
+        self.assertEqual(get_active_admin_ids(), [self.admin.id])
+        with self.assertNumQueries(0):
+            self.assertEqual(get_active_admin_ids(), [self.admin.id])
+
+        self.member.role = "ADMIN"
+        self.member.save(update_fields=["role"])
+        self.assertCountEqual(get_active_admin_ids(), [self.admin.id, self.member.id])
+
+    def test_admin_ids_survive_unrelated_user_saves(self):
+        get_active_admin_ids()
+
+        admin = User.objects.get(pk=self.admin.pk)
+        admin.last_login = timezone.now()
+        admin.save(update_fields=["last_login"])
+        admin.first_name = "Renamed"
+        admin.save()
+
+        with self.assertNumQueries(0):
+            self.assertEqual(get_active_admin_ids(), [self.admin.id])
+
+        admin.is_active = False
+        admin.save()
+        self.assertEqual(get_active_admin_ids(), [])
@@ -0,0 +1,32 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+
+User = get_user_model()
+
+ACTIVE_ADMIN_IDS_CACHE_KEY = "notifications:active-admin-ids"
+
+# Admins change rarely; user saves evict the entry (see
+# notifications.signals) and the TTL covers queryset.update() writes.
+ACTIVE_ADMIN_IDS_TTL = 300
+
+
+def get_active_admin_ids():
+    """
+    Ids of the active, approved admins who receive review notifications,
+    served from Django's cache.
+    """
+    return cache.get_or_set(
+        ACTIVE_ADMIN_IDS_CACHE_KEY,
+        lambda: list(
+            User.objects.filter(
+                role="ADMIN",
+                is_active=True,
+                is_approved=True,
+            ).values_list("id", flat=True)
+        ),
+        ACTIVE_ADMIN_IDS_TTL,
+    )
+
+
+def invalidate_active_admin_ids():
+    cache.delete(ACTIVE_ADMIN_IDS_CACHE_KEY)
@@ -1,16 +1,24 @@
+from django.db.models import Exists
 from rest_framework import viewsets, status, permissions
 from rest_framework.decorators import action
 from rest_framework.response import Response
+from .bulk import insert_notifications_for
 from .models import Notification, NotificationPreference
 from .serializers import NotificationSerializer, NotificationPreferenceSerializer
 from django.contrib.auth import get_user_model
 from accounts.permissions import IsAdminOrTreasurer
+from seedvest.pagination import OptInCursorPagination
 
 User = get_user_model()
 
 
+class NotificationCursorPagination(OptInCursorPagination):
+    ordering = ("-created_at", "-id")
+
+
 class NotificationViewSet(viewsets.ModelViewSet):
     serializer_class = NotificationSerializer
+    pagination_class = NotificationCursorPagination
 
     def get_permissions(self):
         if self.action in ["create", "broadcast"]:
@@ -24,11 +32,16 @@ class NotificationViewSet(viewsets.ModelViewSet):
         return preference
 
     def get_queryset(self):
-        queryset = Notification.objects.filter(recipient=self.request.user)
-        preference = self._get_or_create_preference()
-        if preference.mute_internal_messages:
-            queryset = queryset.exclude(category="INTERNAL")
-        return queryset
+        # The mute preference is checked inside the same query, so reads
+        # neither fetch nor create a preference row.
+        muted = NotificationPreference.objects.filter(
+            user=self.request.user,
+            mute_internal_messages=True,
+        )
+        return Notification.objects.filter(recipient=self.request.user).exclude(
+            Exists(muted),
+            category="INTERNAL",
+        )
 
     @action(detail=True, methods=["post"])
     def mark_read(self, request, pk=None):
@@ -39,9 +52,16 @@ class NotificationViewSet(viewsets.ModelViewSet):
 
     @action(detail=False, methods=["post"])
     def mark_all_read(self, request):
-        self.get_queryset().update(is_read=True)
+        # Muted internal messages are marked read as well, so the UPDATE
+        # needs no preference subquery. Only unread rows are touched; they
+        # are what the partial index covers.
+        updated = Notification.objects.filter(
+            recipient=request.user,
+            is_read=False,
+        ).update(is_read=True)
         return Response(
-            {"status": "all notifications marked as read"}, status=status.HTTP_200_OK
+            {"status": "all notifications marked as read", "updated": updated},
+            status=status.HTTP_200_OK,
         )
 
     @action(detail=False, methods=["get", "patch"])
@@ -73,23 +93,19 @@ class NotificationViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        notifications = [
-            Notification(
-                recipient=user,
-                title=title,
-                message=message,
-                category="INTERNAL",
-                type=notif_type,
-            )
-            for user in User.objects.filter(
+        sent = insert_notifications_for(
+            User.objects.filter(
                 is_active=True,
                 is_approved=True,
                 role__in=["MEMBER", "TREASURER"],
-            )
-        ]
-        Notification.objects.bulk_create(notifications)
+            ),
+            title=title,
+            message=message,
+            category="INTERNAL",
+            type=notif_type,
+        )
 
         return Response(
-            {"status": f"Broadcast sent to {len(notifications)} users"},
+            {"status": f"Broadcast sent to {sent} users"},
             status=status.HTTP_201_CREATED,
         )
@@ -0,0 +1,36 @@
+from datetime import timedelta
+from django.core.management.base import BaseCommand
+from payments.services.reconcile import reconcile_pending
+
+
+class Command(BaseCommand):
+    help = "Settle pending M-Pesa transactions whose callback never arrived"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--min-age-seconds",
+            type=int,
+            default=60,
+            help="Skip transactions younger than this many seconds",
+        )
+        parser.add_argument(
+            "--max-age-minutes",
+            type=int,
+            default=60,
+            help="Skip transactions older than this many minutes",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Show what would happen without making changes",
+        )
+
+    def handle(self, *args, **options):
+        settled, errors = reconcile_pending(
+            min_age=timedelta(seconds=options["min_age_seconds"]),
+            max_age=timedelta(minutes=options["max_age_minutes"]),
+            dry_run=options["dry_run"],
+        )
+        self.stdout.write(self.style.SUCCESS(f"  Settled: {settled}"))
+        for error in errors:
+            self.stderr.write(self.style.ERROR(f"  Error: {error}"))
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.10 on 2026-10-15 23:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("payments", "0005_mpesatransaction_group"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="mpesatransaction",
+            index=models.Index(
+                condition=models.Q(("status", "PENDING")),
+                fields=["created_at"],
+                name="mpesa_tx_pending_created_idx",
+            ),
+        ),
+    ]
@@ -37,5 +37,17 @@ class MpesaTransaction(models.Model):
     raw_callback = models.JSONField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            # Most transactions settle quickly; index only the pending ones
+            # that status sweeps look for (status = 'PENDING' AND
+            # created_at < ?).
+            models.Index(
+                fields=["created_at"],
+                condition=models.Q(status="PENDING"),
+                name="mpesa_tx_pending_created_idx",
+            ),
+        ]
+
     def __str__(self):
         return f"{self.phone_number} - {self.amount} - {self.status}"
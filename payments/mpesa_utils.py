@@ -1,27 +1,22 @@
-import os
 from datetime import datetime
 import base64
-from dotenv import load_dotenv
-
-# Load environment variables
-load_dotenv()
-
-MPESA_SHORTCODE = os.getenv("MPESA_SHORTCODE")
-MPESA_PASSKEY = os.getenv("MPESA_PASSKEY")
-MPESA_CALLBACK_URL = os.getenv("MPESA_CALLBACK_URL")
-MPESA_CONSUMER_KEY = os.getenv("MPESA_CONSUMER_KEY")
-MPESA_CONSUMER_SECRET = os.getenv("MPESA_CONSUMER_SECRET")
+from django.conf import settings
 
 
 def generate_timestamp():
-    return datetime.now().strftime("%Y%m%d%H%M%S")
+    # YYYYMMDDHHMMSS; a fixed-width f-string skips strftime's format parsing.
+    now = datetime.now()
+    return (
+        f"{now.year:04d}{now.month:02d}{now.day:02d}"
+        f"{now.hour:02d}{now.minute:02d}{now.second:02d}"
+    )
 
 
 def generate_password():
-    # """
-    # Password = Base64(BusinessShortCode + Passkey + Timestamp)
-    # """
+    """
+    Password = Base64(BusinessShortCode + Passkey + Timestamp)
+    """
     timestamp = generate_timestamp()
-    data_to_encode = f"{MPESA_SHORTCODE}{MPESA_PASSKEY}{timestamp}"
+    data_to_encode = f"{settings.MPESA_SHORTCODE}{settings.MPESA_PASSKEY}{timestamp}"
     encoded_string = base64.b64encode(data_to_encode.encode()).decode()
     return encoded_string, timestamp
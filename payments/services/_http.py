@@ -0,0 +1,24 @@
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# (connect, read) seconds. Connecting to Daraja is quick when it is up;
+# STK push itself can take a while to answer.
+DEFAULT_TIMEOUT = (5, 20)
+
+# Shared across the M-Pesa service calls so the TLS connection to Daraja is
+# kept alive and reused. Retry's default allowed_methods leaves POST out, so
+# a payment request is never sent twice.
+SESSION = requests.Session()
+SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=50,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[502, 503, 504],
+        ),
+    ),
+)
@@ -1,21 +1,49 @@
 import base64
-import requests
+import threading
 from requests import RequestException
 from django.conf import settings
+from django.core.cache import cache
+from ._http import DEFAULT_TIMEOUT, SESSION
 from .exceptions import MpesaAPIError
 
+ACCESS_TOKEN_CACHE_KEY = "payments:mpesa-access-token"
+
+# Safaricom tokens live for about an hour; renew a minute early so a token
+# never expires between being read from the cache and reaching Daraja.
+ACCESS_TOKEN_EXPIRY_MARGIN = 60
+
+_token_lock = threading.Lock()
+
 
 def get_access_token():
+    """
+    Return a Daraja OAuth token, fetching a new one only when the cached
+    token is missing or about to expire.
+    """
+    token = cache.get(ACCESS_TOKEN_CACHE_KEY)
+    if token:
+        return token
+
+    # One refresh per process at a time; concurrent callers wait for it
+    # and then read the token it cached.
+    with _token_lock:
+        token = cache.get(ACCESS_TOKEN_CACHE_KEY)
+        if token:
+            return token
+        return _fetch_access_token()
+
+
+def _fetch_access_token():
     consumer_key = settings.MPESA_CONSUMER_KEY
     consumer_secret = settings.MPESA_CONSUMER_SECRET
 
     auth = base64.b64encode(f"{consumer_key}:{consumer_secret}".encode()).decode()
 
     try:
-        response = requests.get(
+        response = SESSION.get(
             "https://sandbox.safaricom.co.ke/oauth/v1/generate?grant_type=client_credentials",
             headers={"Authorization": f"Basic {auth}"},
-            timeout=20,
+            timeout=DEFAULT_TIMEOUT,
         )
     except RequestException as exc:
         raise MpesaAPIError("Unable to reach M-Pesa OAuth service.") from exc
@@ -38,4 +66,12 @@ def get_access_token():
     token = payload.get("access_token")
     if not token:
         raise MpesaAPIError("M-Pesa OAuth response did not include access_token.")
+
+    try:
+        expires_in = int(payload.get("expires_in", 3599))
+    except (TypeError, ValueError):
+        expires_in = 3599
+    timeout = expires_in - ACCESS_TOKEN_EXPIRY_MARGIN
+    if timeout > 0:
+        cache.set(ACCESS_TOKEN_CACHE_KEY, token, timeout)
     return token
@@ -1,18 +1,13 @@
-import base64
-import datetime
-import requests
 from requests import RequestException
 from django.conf import settings
+from payments.mpesa_utils import generate_password
 from .mpesa_auth import get_access_token
+from ._http import DEFAULT_TIMEOUT, SESSION
 from .exceptions import MpesaAPIError
 
 def query_stk_status(checkout_request_id):
     access_token = get_access_token()
-    timestamp = datetime.datetime.now().strftime("%Y%m%d%H%M%S")
-
-    password = base64.b64encode(
-        f"{settings.MPESA_SHORTCODE}{settings.MPESA_PASSKEY}{timestamp}".encode()
-    ).decode()
+    password, timestamp = generate_password()
 
     payload = {
         "BusinessShortCode": settings.MPESA_SHORTCODE,
@@ -22,11 +17,11 @@ def query_stk_status(checkout_request_id):
     }
 
     try:
-        response = requests.post(
+        response = SESSION.post(
             "https://sandbox.safaricom.co.ke/mpesa/stkpushquery/v1/query",
             json=payload,
             headers={"Authorization": f"Bearer {access_token}"},
-            timeout=20,
+            timeout=DEFAULT_TIMEOUT,
         )
     except RequestException as exc:
         raise MpesaAPIError("Unable to reach M-Pesa STK status endpoint.") from exc
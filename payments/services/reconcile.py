@@ -0,0 +1,97 @@
+import logging
+from datetime import timedelta
+from django.utils import timezone
+from payments.models import MpesaTransaction
+from payments.signals import schedule_payment_completion
+from .exceptions import MpesaAPIError
+from .query_status import query_stk_status
+
+logger = logging.getLogger(__name__)
+
+# STK query result codes that settle a transaction. Anything else (e.g. the
+# request is still being processed) leaves it PENDING.
+SETTLED_RESULT_CODES = {
+    "0": "SUCCESS",
+    "1032": "FAILED",  # Cancelled by user
+    "1037": "FAILED",  # Timeout
+}
+
+
+def status_from_query(query_res):
+    return SETTLED_RESULT_CODES.get(str(query_res.get("ResultCode")))
+
+
+def settle_transaction(transaction, new_status, result_desc, **fields):
+    """
+    Move a PENDING transaction to new_status, writing any extra fields
+    alongside. Returns False, after reloading the stored result, when
+    something else settled it first.
+    """
+    # Conditional UPDATE: only the first writer moves the row out of
+    # PENDING, so the callback, a status poll and the reconciler cannot
+    # overwrite each other or complete the same payment twice.
+    fields.update(status=new_status, result_desc=result_desc)
+    updated = MpesaTransaction.objects.filter(
+        pk=transaction.pk,
+        status="PENDING",
+    ).update(**fields)
+    if not updated:
+        transaction.refresh_from_db(
+            fields=["status", "result_desc", "mpesa_receipt_number"]
+        )
+        return False
+
+    for name, value in fields.items():
+        setattr(transaction, name, value)
+    # update() skips post_save, so hand off to the completion handler
+    # directly.
+    if new_status == "SUCCESS":
+        schedule_payment_completion(transaction)
+    return True
+
+
+def reconcile_pending(min_age=timedelta(minutes=1), max_age=timedelta(hours=1), dry_run=False):
+    """
+    Query Daraja for PENDING transactions whose callback never arrived.
+
+    Transactions younger than min_age are skipped to give the callback a
+    chance; older than max_age are left alone as abandoned.
+    Returns (settled, errors).
+    """
+    now = timezone.now()
+    pending = MpesaTransaction.objects.filter(
+        status="PENDING",
+        created_at__lte=now - min_age,
+        created_at__gte=now - max_age,
+    ).only(
+        "id",
+        "checkout_request_id",
+        "user_id",
+        "contribution_id",
+        "group_id",
+        "amount",
+        "mpesa_receipt_number",
+    )
+
+    settled = 0
+    errors = []
+    for transaction in pending.iterator():
+        try:
+            query_res = query_stk_status(transaction.checkout_request_id)
+        except MpesaAPIError as e:
+            errors.append(f"{transaction.checkout_request_id}: {e}")
+            continue
+
+        new_status = status_from_query(query_res)
+        if not new_status:
+            continue
+        if dry_run:
+            settled += 1
+            continue
+        if settle_transaction(transaction, new_status, query_res.get("ResultDesc")):
+            settled += 1
+            logger.info(
+                f"Reconciled {transaction.checkout_request_id} as {new_status}"
+            )
+
+    return settled, errors
@@ -1,7 +1,9 @@
+from django.db import transaction
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 from django.utils import timezone
 from .models import MpesaTransaction
+from notifications.bulk import queue_notifications
 from notifications.models import Notification
 
 @receiver(post_save, sender=MpesaTransaction)
@@ -12,33 +14,49 @@ def handle_mpesa_payment_completion(sender, instance, created, **kwargs):
     2. Sends a notification to the user.
     """
     if instance.status == "SUCCESS":
-        # 1. Update the linked contribution if it exists
-        if instance.contribution:
-            contribution = instance.contribution
-            if contribution.status != "PAID":
-                contribution.status = "PAID"
-                contribution.paid_date = timezone.now().date()
-                contribution.save()
-        elif instance.group and instance.user:
-            # If it's a dashboard-initiated payment (no specific contribution ID)
-            # Create a new PAID contribution for that group
-            from finance.models import Contribution
-            Contribution.objects.create(
-                user=instance.user,
-                group=instance.group,
-                amount=instance.amount,
-                status="PAID",
-                paid_date=timezone.now().date(),
-                due_date=timezone.now().date(),
-                is_manual_entry=False
-            )
-        
-        # 2. Send notification to the user
-        if instance.user:
-            Notification.objects.create(
-                recipient=instance.user,
+        schedule_payment_completion(instance)
+
+
+def schedule_payment_completion(instance):
+    # Runs once the transaction row is committed, so the save that
+    # recorded the payment is not held open by this follow-up work and a
+    # rolled-back save never marks anything paid.
+    transaction.on_commit(lambda: _complete_payment(instance))
+
+
+def _complete_payment(instance):
+    from finance.models import Contribution
+
+    today = timezone.now().date()
+
+    # 1. Update the linked contribution if it exists
+    if instance.contribution_id:
+        contribution = Contribution.objects.filter(pk=instance.contribution_id).first()
+        if contribution and contribution.status != "PAID":
+            contribution.status = "PAID"
+            contribution.paid_date = today
+            contribution.save()
+    elif instance.group_id and instance.user_id:
+        # If it's a dashboard-initiated payment (no specific contribution ID)
+        # Create a new PAID contribution for that group
+        Contribution.objects.create(
+            user_id=instance.user_id,
+            group_id=instance.group_id,
+            amount=instance.amount,
+            status="PAID",
+            paid_date=today,
+            due_date=today,
+            is_manual_entry=False
+        )
+
+    # 2. Send notification to the user
+    if instance.user_id:
+        queue_notifications([
+            Notification(
+                recipient_id=instance.user_id,
                 title="Payment Successful",
                 message=f"Your M-Pesa payment of KES {instance.amount} was successful. Receipt: {instance.mpesa_receipt_number}",
                 type="SUCCESS",
                 link=f"/payments/transactions/{instance.id}/"
             )
+        ])
@@ -1,12 +1,25 @@
-from django.test import TestCase
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase, override_settings
 from django.urls import reverse
+from django.utils import timezone
 from unittest.mock import patch
 from .models import MpesaTransaction
+from .mpesa_utils import generate_password
 from .services.exceptions import MpesaAPIError
+from .services.mpesa_auth import get_access_token
+from .services.reconcile import reconcile_pending
 from accounts.models import User
+from finance.models import Contribution
+from groups.models import Group
+from notifications.models import Notification
 from rest_framework.test import APIClient
 from rest_framework_simplejwt.tokens import RefreshToken
+import base64
+from io import StringIO
 import json
+from datetime import date, timedelta
+from decimal import Decimal
 
 class MpesaCallbackTests(TestCase):
     def setUp(self):
@@ -107,6 +120,37 @@ class MpesaCallbackTests(TestCase):
                 ).exists()
             )
 
+    @patch("payments.views.stk_push")
+    def test_initiate_payment_links_contribution_and_group(self, mock_stk_push):
+        mock_stk_push.return_value = {
+            "MerchantRequestID": "test-merchant-link",
+            "CheckoutRequestID": "test-checkout-link",
+        }
+        group = Group.objects.create(name="Link Group", treasurer=self.user)
+        contribution = Contribution.objects.create(
+            user=self.user,
+            group=group,
+            amount=Decimal("100.00"),
+            due_date=date.today(),
+            status="PENDING",
+        )
+
+        response = self.client.post(
+            self.payment_url,
+            {
+                "phone": "254708873060",
+                "amount": 100,
+                "contribution_id": contribution.id,
+                "group_id": 999999,
+            },
+        )
+
+        self.assertEqual(response.status_code, 200)
+        transaction = MpesaTransaction.objects.get(checkout_request_id="test-checkout-link")
+        self.assertEqual(transaction.user_id, self.user.id)
+        self.assertEqual(transaction.contribution_id, contribution.id)
+        self.assertIsNone(transaction.group_id)
+
     def test_initiate_payment_rejects_invalid_phone(self):
         payload = {
             "phone_number": "12345",
@@ -177,6 +221,141 @@ class MpesaCallbackTests(TestCase):
         self.assertEqual(transaction.mpesa_receipt_number, "UBCEJ6G79B")
         self.assertEqual(transaction.result_code, 0)
 
+    def test_callback_success_settles_contribution_after_commit(self):
+        group = Group.objects.create(name="Callback Group", treasurer=self.user)
+        contribution = Contribution.objects.create(
+            user=self.user,
+            group=group,
+            amount=Decimal("100.00"),
+            due_date=date.today(),
+            status="PENDING",
+        )
+        MpesaTransaction.objects.create(
+            user=self.user,
+            contribution=contribution,
+            checkout_request_id="ws_CO_commit",
+            amount=100,
+            phone_number="254708873060",
+        )
+        callback_data = {
+            "Body": {
+                "stkCallback": {
+                    "CheckoutRequestID": "ws_CO_commit",
+                    "ResultCode": 0,
+                    "ResultDesc": "Success",
+                }
+            }
+        }
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.client.post(
+                self.callback_url,
+                data=json.dumps(callback_data),
+                content_type="application/json"
+            )
+        contribution.refresh_from_db()
+        self.assertEqual(contribution.status, "PENDING")
+        self.assertFalse(
+            Notification.objects.filter(
+                recipient=self.user, title="Payment Successful"
+            ).exists()
+        )
+
+        for callback in callbacks:
+            callback()
+        contribution.refresh_from_db()
+        self.assertEqual(contribution.status, "PAID")
+        self.assertTrue(
+            Notification.objects.filter(
+                recipient=self.user, title="Payment Successful"
+            ).exists()
+        )
+
+    def test_redelivered_callback_is_not_reapplied(self):
+        group = Group.objects.create(name="Redelivery Group", treasurer=self.user)
+        MpesaTransaction.objects.create(
+            user=self.user,
+            group=group,
+            checkout_request_id="ws_CO_redelivered",
+            amount=100,
+            phone_number="254708873060",
+        )
+        callback_data = {
+            "Body": {
+                "stkCallback": {
+                    "CheckoutRequestID": "ws_CO_redelivered",
+                    "ResultCode": 0,
+                    "ResultDesc": "Success",
+                }
+            }
+        }
+
+        for _ in range(2):
+            with self.captureOnCommitCallbacks(execute=True):
+                response = self.client.post(
+                    self.callback_url,
+                    data=json.dumps(callback_data),
+                    content_type="application/json"
+                )
+            self.assertEqual(response.status_code, 200)
+
+        self.assertEqual(
+            Contribution.objects.filter(user=self.user, group=group, status="PAID").count(),
+            1,
+        )
+
+    def test_callback_after_poll_adds_receipt_only(self):
+        transaction = MpesaTransaction.objects.create(
+            checkout_request_id="ws_CO_polled",
+            amount=10,
+            phone_number="254708873060",
+            status="SUCCESS",
+            result_desc="Processed",
+        )
+        callback_data = {
+            "Body": {
+                "stkCallback": {
+                    "CheckoutRequestID": "ws_CO_polled",
+                    "ResultCode": 0,
+                    "ResultDesc": "Success",
+                    "CallbackMetadata": {
+                        "Item": [{"Name": "MpesaReceiptNumber", "Value": "LATE123"}]
+                    },
+                }
+            }
+        }
+
+        response = self.client.post(
+            self.callback_url,
+            data=json.dumps(callback_data),
+            content_type="application/json"
+        )
+
+        self.assertEqual(response.status_code, 200)
+        transaction.refresh_from_db()
+        self.assertEqual(transaction.status, "SUCCESS")
+        self.assertEqual(transaction.result_desc, "Processed")
+        self.assertEqual(transaction.mpesa_receipt_number, "LATE123")
+
+    def test_callback_rejects_oversized_payload(self):
+        response = self.client.post(
+            self.callback_url,
+            data=json.dumps({"padding": "x" * (64 * 1024)}),
+            content_type="application/json"
+        )
+
+        self.assertEqual(response.status_code, 413)
+
+    def test_callback_rejects_malformed_json(self):
+        response = self.client.post(
+            self.callback_url,
+            data="{not json",
+            content_type="application/json"
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()["ResultDesc"], "Invalid data")
+
     def test_callback_non_existent_transaction_returns_404(self):
         callback_data = {
             "Body": {
@@ -221,3 +400,170 @@ class MpesaCallbackTests(TestCase):
         self.assertEqual(response.status_code, 200)
         transaction.refresh_from_db()
         self.assertEqual(transaction.status, "PENDING")
+
+
+    @patch("payments.views.query_stk_status")
+    def test_status_query_success_settles_contribution(self, mock_query_stk_status):
+        mock_query_stk_status.return_value = {"ResultCode": "0", "ResultDesc": "Processed"}
+        group = Group.objects.create(name="Poll Group", treasurer=self.user)
+        contribution = Contribution.objects.create(
+            user=self.user,
+            group=group,
+            amount=Decimal("100.00"),
+            due_date=date.today(),
+            status="PENDING",
+        )
+        transaction = MpesaTransaction.objects.create(
+            user=self.user,
+            contribution=contribution,
+            checkout_request_id="ws_CO_poll_success",
+            amount=100,
+            phone_number="254708873060",
+        )
+        status_url = reverse(
+            "mpesa-status",
+            kwargs={"checkout_request_id": transaction.checkout_request_id},
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.get(status_url)
+
+        self.assertEqual(response.data["status"], "SUCCESS")
+        transaction.refresh_from_db()
+        self.assertEqual(transaction.status, "SUCCESS")
+        contribution.refresh_from_db()
+        self.assertEqual(contribution.status, "PAID")
+
+    @patch("payments.views.query_stk_status")
+    def test_status_query_does_not_overwrite_settled_transaction(self, mock_query_stk_status):
+        transaction = MpesaTransaction.objects.create(
+            checkout_request_id="ws_CO_poll_race",
+            amount=10,
+            phone_number="254708873060",
+        )
+
+        def callback_wins(checkout_request_id):
+            MpesaTransaction.objects.filter(pk=transaction.pk).update(
+                status="SUCCESS",
+                mpesa_receipt_number="RACE123",
+            )
+            return {"ResultCode": "1032", "ResultDesc": "Cancelled"}
+
+        mock_query_stk_status.side_effect = callback_wins
+        status_url = reverse(
+            "mpesa-status",
+            kwargs={"checkout_request_id": transaction.checkout_request_id},
+        )
+
+        response = self.client.get(status_url)
+
+        self.assertEqual(response.data["status"], "SUCCESS")
+        self.assertEqual(response.data["receipt"], "RACE123")
+        transaction.refresh_from_db()
+        self.assertEqual(transaction.status, "SUCCESS")
+
+class MpesaAuthTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    @patch("payments.services.mpesa_auth.SESSION.get")
+    def test_access_token_is_cached(self, mock_get):
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.json.return_value = {
+            "access_token": "token-1",
+            "expires_in": "3599",
+        }
+
+        self.assertEqual(get_access_token(), "token-1")
+        self.assertEqual(get_access_token(), "token-1")
+        mock_get.assert_called_once()
+
+    @patch("payments.services.mpesa_auth.SESSION.get")
+    def test_failed_oauth_is_not_cached(self, mock_get):
+        mock_get.return_value.status_code = 400
+        mock_get.return_value.json.return_value = {"errorMessage": "Bad credentials"}
+
+        with self.assertRaises(MpesaAPIError):
+            get_access_token()
+        with self.assertRaises(MpesaAPIError):
+            get_access_token()
+        self.assertEqual(mock_get.call_count, 2)
+
+
+class MpesaPasswordTests(TestCase):
+    @override_settings(MPESA_SHORTCODE="174379", MPESA_PASSKEY="passkey")
+    @patch("payments.mpesa_utils.generate_timestamp", return_value="20260212153744")
+    def test_password_encodes_shortcode_passkey_and_timestamp(self, mock_timestamp):
+        password, timestamp = generate_password()
+
+        self.assertEqual(timestamp, "20260212153744")
+        self.assertEqual(
+            base64.b64decode(password).decode(),
+            "174379passkey20260212153744",
+        )
+        self.assertEqual(generate_password(), (password, timestamp))
+
+    @patch("payments.mpesa_utils.generate_timestamp", return_value="20260212153744")
+    def test_password_follows_passkey_changes(self, mock_timestamp):
+        with override_settings(MPESA_SHORTCODE="174379", MPESA_PASSKEY="old"):
+            old_password, _ = generate_password()
+        with override_settings(MPESA_SHORTCODE="174379", MPESA_PASSKEY="new"):
+            new_password, _ = generate_password()
+
+        self.assertNotEqual(old_password, new_password)
+
+
+class MpesaReconcileTests(TestCase):
+    def setUp(self):
+        self.stale = MpesaTransaction.objects.create(
+            checkout_request_id="ws_CO_stale",
+            amount=10,
+            phone_number="254708873060",
+        )
+        MpesaTransaction.objects.filter(pk=self.stale.pk).update(
+            created_at=timezone.now() - timedelta(minutes=5)
+        )
+        self.fresh = MpesaTransaction.objects.create(
+            checkout_request_id="ws_CO_fresh",
+            amount=10,
+            phone_number="254708873060",
+        )
+
+    @patch("payments.services.reconcile.query_stk_status")
+    def test_reconcile_settles_stale_pending_transactions(self, mock_query_stk_status):
+        mock_query_stk_status.return_value = {"ResultCode": "1032", "ResultDesc": "Cancelled"}
+
+        settled, errors = reconcile_pending()
+
+        self.assertEqual((settled, errors), (1, []))
+        mock_query_stk_status.assert_called_once_with("ws_CO_stale")
+        self.stale.refresh_from_db()
+        self.fresh.refresh_from_db()
+        self.assertEqual(self.stale.status, "FAILED")
+        self.assertEqual(self.fresh.status, "PENDING")
+
+    @patch("payments.services.reconcile.query_stk_status")
+    def test_reconcile_leaves_unfinished_transactions_pending(self, mock_query_stk_status):
+        mock_query_stk_status.return_value = {"ResultCode": "4999", "ResultDesc": "Still processing"}
+
+        settled, errors = reconcile_pending()
+
+        self.assertEqual((settled, errors), (0, []))
+        self.stale.refresh_from_db()
+        self.assertEqual(self.stale.status, "PENDING")
+
+    @patch("payments.services.reconcile.query_stk_status")
+    def test_reconcile_command_takes_ages_with_units(self, mock_query_stk_status):
+        mock_query_stk_status.return_value = {"ResultCode": "0", "ResultDesc": "Processed"}
+        out = StringIO()
+
+        call_command(
+            "reconcile_mpesa_payments",
+            "--min-age-seconds=600",
+            "--max-age-minutes=60",
+            "--dry-run",
+            stdout=out,
+        )
+
+        self.assertIn("Settled: 0", out.getvalue())
+        mock_query_stk_status.assert_not_called()
@@ -14,6 +14,7 @@ from .models import MpesaTransaction
 from .services.stk_push import stk_push
 from .services.query_status import query_stk_status
 from .services.exceptions import MpesaAPIError
+from .services.reconcile import settle_transaction, status_from_query
 from finance.models import Contribution
 from decimal import Decimal, InvalidOperation
 
@@ -76,24 +77,29 @@ class InitiateMpesaPaymentView(APIView):
             )
 
         # Associate with user if authenticated
-        user = request.user if request.user.is_authenticated else None
-        
-        contribution = None
+        user_id = request.user.id if request.user.is_authenticated else None
+
+        # Only the ids are stored, so check existence without loading rows.
+        linked_contribution_id = None
         if contribution_id:
-            try:
-                contribution = Contribution.objects.get(id=contribution_id)
-            except Contribution.DoesNotExist:
+            linked_contribution_id = (
+                Contribution.objects.filter(id=contribution_id)
+                .values_list("id", flat=True)
+                .first()
+            )
+            if linked_contribution_id is None:
                 logger.warning(f"Contribution with ID {contribution_id} not found.")
-                pass
 
-        group = None
+        linked_group_id = None
         if group_id:
-            try:
-                from groups.models import Group
-                group = Group.objects.get(id=group_id)
-            except Group.DoesNotExist:
+            from groups.models import Group
+            linked_group_id = (
+                Group.objects.filter(id=group_id)
+                .values_list("id", flat=True)
+                .first()
+            )
+            if linked_group_id is None:
                 logger.warning(f"Group with ID {group_id} not found.")
-                pass
 
         try:
             # Safaricom expects integer amount in KES
@@ -114,9 +120,9 @@ class InitiateMpesaPaymentView(APIView):
 
         if "CheckoutRequestID" in response:
             transaction = MpesaTransaction.objects.create(
-                user=user,
-                contribution=contribution,
-                group=group,
+                user_id=user_id,
+                contribution_id=linked_contribution_id,
+                group_id=linked_group_id,
                 phone_number=phone,
                 amount=amount_decimal,
                 checkout_request_id=response["CheckoutRequestID"],
@@ -130,10 +136,32 @@ class InitiateMpesaPaymentView(APIView):
         return Response(response, status=status.HTTP_400_BAD_REQUEST)
 
 
+# STK callbacks are around 1 KB; anything far larger is not from Daraja.
+MAX_CALLBACK_BYTES = 64 * 1024
+
+
 @csrf_exempt
 def mpesa_callback(request):
     try:
-        data = json.loads(request.body)
+        # Check the declared size before reading the body, then the actual
+        # size for requests that don't declare one.
+        try:
+            declared_length = int(request.META.get("CONTENT_LENGTH") or 0)
+        except ValueError:
+            declared_length = 0
+        if declared_length > MAX_CALLBACK_BYTES or len(request.body) > MAX_CALLBACK_BYTES:
+            logger.error("Invalid callback data: payload too large")
+            return JsonResponse({"ResultCode": 1, "ResultDesc": "Payload too large"}, status=413)
+
+        try:
+            data = json.loads(request.body)
+        except ValueError:
+            logger.error("Invalid callback data: body is not JSON")
+            return JsonResponse({"ResultCode": 1, "ResultDesc": "Invalid data"}, status=400)
+        if not isinstance(data, dict):
+            logger.error("Invalid callback data: body is not a JSON object")
+            return JsonResponse({"ResultCode": 1, "ResultDesc": "Invalid data"}, status=400)
+
         logger.info("--- M-PESA CALLBACK RECEIVED ---")
         logger.info(json.dumps(data, indent=4))
         
@@ -153,23 +181,39 @@ def mpesa_callback(request):
             logger.error(f"Transaction with CheckoutRequestID {checkout_id} not found in database.")
             return JsonResponse({"ResultCode": 1, "ResultDesc": "Transaction not found"}, status=404)
 
-        transaction.raw_callback = data
-        transaction.result_code = stk.get("ResultCode")
-        transaction.result_desc = stk.get("ResultDesc")
+        result_desc = stk.get("ResultDesc") or ""
+        fields = {"raw_callback": data, "result_code": stk.get("ResultCode")}
 
         if stk.get("ResultCode") == 0:
-            transaction.status = "SUCCESS"
+            new_status = "SUCCESS"
             # Extract metadata
-            metadata = stk.get("CallbackMetadata", {}).get("Item", [])
-            for item in metadata:
-                if item["Name"] == "MpesaReceiptNumber":
-                    transaction.mpesa_receipt_number = item["Value"]
-            logger.info(f"Transaction {checkout_id} marked as SUCCESS")
+            metadata = {
+                item["Name"]: item.get("Value")
+                for item in stk.get("CallbackMetadata", {}).get("Item", [])
+                if "Name" in item
+            }
+            if "MpesaReceiptNumber" in metadata:
+                fields["mpesa_receipt_number"] = metadata["MpesaReceiptNumber"]
         else:
-            transaction.status = "FAILED"
-            logger.warning(f"Transaction {checkout_id} marked as FAILED. Reason: {transaction.result_desc}")
+            new_status = "FAILED"
 
-        transaction.save()
+        if settle_transaction(transaction, new_status, result_desc, **fields):
+            if new_status == "SUCCESS":
+                logger.info(f"Transaction {checkout_id} marked as SUCCESS")
+            else:
+                logger.warning(f"Transaction {checkout_id} marked as FAILED. Reason: {result_desc}")
+        else:
+            # Safaricom redelivered the callback, or a status poll settled
+            # the transaction first. Keep that outcome; only fill in the
+            # receipt the poll could not provide.
+            logger.info(
+                f"Transaction {checkout_id} already {transaction.status}; callback not reapplied"
+            )
+            if fields.get("mpesa_receipt_number") and not transaction.mpesa_receipt_number:
+                MpesaTransaction.objects.filter(pk=transaction.pk).update(
+                    raw_callback=data,
+                    mpesa_receipt_number=fields["mpesa_receipt_number"],
+                )
         return JsonResponse({"ResultCode": 0, "ResultDesc": "Accepted"})
 
     except Exception as e:
@@ -179,6 +223,7 @@ def mpesa_callback(request):
 
 class MpesaTransactionStatusView(APIView):
     permission_classes = [AllowAny]
+
     def get(self, request, checkout_request_id):
         try:
             transaction = MpesaTransaction.objects.get(checkout_request_id=checkout_request_id)
@@ -187,15 +232,9 @@ class MpesaTransactionStatusView(APIView):
             if transaction.status == "PENDING":
                 try:
                     query_res = query_stk_status(checkout_request_id)
-                    result_code = str(query_res.get("ResultCode"))
-                    if result_code == "0":
-                        transaction.status = "SUCCESS"
-                        transaction.result_desc = query_res.get("ResultDesc")
-                        transaction.save()
-                    elif result_code in ["1032", "1037"]: # Cancelled or Timeout
-                        transaction.status = "FAILED"
-                        transaction.result_desc = query_res.get("ResultDesc")
-                        transaction.save()
+                    new_status = status_from_query(query_res)
+                    if new_status:
+                        settle_transaction(transaction, new_status, query_res.get("ResultDesc"))
                 except MpesaAPIError as e:
                     logger.warning(
                         f"Unable to query STK status for {checkout_request_id}: {str(e)}"
@@ -1,6 +1,8 @@
 from pathlib import Path
 from datetime import timedelta
+from importlib.util import find_spec
 import os
+import sys
 
 from dotenv import load_dotenv
 # =========================
@@ -62,6 +64,28 @@ MIDDLEWARE = [
 ROOT_URLCONF = "seedvest.urls"
 
 
+# =========================
+# Query profiling (dev only)
+# =========================
+# Opt-in with ENABLE_QUERY_PROFILING=True on a DEBUG build. Each tool is only
+# wired in when it is installed, so production images never load it.
+
+ENABLE_QUERY_PROFILING = DEBUG and os.getenv("ENABLE_QUERY_PROFILING") == "True"
+
+if ENABLE_QUERY_PROFILING and find_spec("silk"):
+    INSTALLED_APPS += ["silk"]
+    MIDDLEWARE += ["silk.middleware.SilkyMiddleware"]
+    SILKY_PYTHON_PROFILER = True
+    SILKY_META = True
+
+if ENABLE_QUERY_PROFILING and find_spec("qinspect"):
+    MIDDLEWARE += ["qinspect.middleware.QueryInspectMiddleware"]
+    QUERY_INSPECT_ENABLED = True
+    QUERY_INSPECT_LOG_STATS = True
+    QUERY_INSPECT_LOG_QUERIES = True
+    QUERY_INSPECT_ABSOLUTE_LIMIT = int(os.getenv("QUERY_INSPECT_ABSOLUTE_LIMIT", "50"))
+
+
 # =========================
 # JWT & DRF
 # =========================
@@ -122,6 +146,16 @@ DATABASES = {
         "PASSWORD": os.getenv("DB_PASSWORD", ""),
         "HOST": os.getenv("DB_HOST", "localhost"),
         "PORT": os.getenv("DB_PORT", "5432"),
+        # Keep connections open across requests instead of reconnecting for
+        # each one; health checks drop connections the server has closed.
+        # DB_CONN_MAX_AGE=0 restores per-request connections.
+        "CONN_MAX_AGE": int(os.getenv("DB_CONN_MAX_AGE", "600")),
+        "CONN_HEALTH_CHECKS": True,
+        # Fixed name so `manage.py test --keepdb` can reuse the schema
+        # between runs instead of re-applying every migration.
+        "TEST": {
+            "NAME": os.getenv("DB_TEST_NAME", "test_seedvest"),
+        },
     }
 }
 
@@ -200,6 +234,17 @@ AUTHENTICATION_BACKENDS = [
 ]
 PASSWORD_RESET_TIMEOUT = 1800  # 30 minutes
 
+# =========================
+# Test runs
+# =========================
+# PBKDF2 dominates fixture setup in the test suite; a fast hasher keeps
+# create_user() cheap. Never active outside `manage.py test`.
+
+TESTING = len(sys.argv) > 1 and sys.argv[1] == "test"
+
+if TESTING:
+    PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+
 # =========================
 # M-Pesa ENV configuration
 # =========================